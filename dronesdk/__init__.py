@@ -38,63 +38,144 @@ The implementation has been refactored into a modular architecture.
 
 from __future__ import annotations
 
-# Core infrastructure
-from dronesdk.core.exceptions import APIException, TimeoutError
-from dronesdk.core.observer import HasObservers
-from dronesdk.core.events import EventBus, EventPriority, MAVLinkMessageEvent
-from dronesdk.core.types import Observable, VehicleModule, ConnectionProtocol
-
-# Data models
-from dronesdk.models.location import (
-    LocationGlobal,
-    LocationGlobalRelative,
-    LocationLocal,
-)
-from dronesdk.models.attitude import Attitude
-from dronesdk.models.battery import Battery
-from dronesdk.models.sensors import GPSInfo, Rangefinder, Wind
-from dronesdk.models.version import Version, Capabilities
-from dronesdk.models.status import VehicleMode, SystemStatus
-from dronesdk.models.command import Command
-
-# Data link
-from dronesdk.datalink.connection import MAVConnection, MAVWriter
-from dronesdk.datalink.heartbeat import HeartbeatManager
-from dronesdk.datalink.message_router import MessageRouter
-
-# Modules
-from dronesdk.sensors.manager import SensorManager
-from dronesdk.sensors.location import Locations
-from dronesdk.power.monitor import BatteryMonitor
-from dronesdk.health.monitor import HealthMonitor, EKFStatus
-from dronesdk.parameters.manager import ParameterManager
-from dronesdk.channels.reader import Channels
-from dronesdk.channels.override import ChannelsOverride
-from dronesdk.gimbal.controller import GimbalController, GimbalState
-from dronesdk.mission.sequence import CommandSequence
-from dronesdk.mission.manager import MissionManager
-from dronesdk.flight_control.controller import FlightController
-from dronesdk.flight_control.navigation import (
-    get_distance_metres,
-    get_location_metres,
-    get_bearing,
-)
-
-# Logging utilities (from original util.py for backwards compatibility)
-from dronesdk.util import ErrprinterHandler
-
-# Compatibility layer (main public API)
-from dronesdk.compat.facade import Vehicle
-from dronesdk.compat.connect import connect
-
-# Re-export pymavlink for convenience
-from pymavlink import mavutil
-
-# Legacy alias for Parameters class
-Parameters = ParameterManager
-
-# Legacy alias for Gimbal class
-Gimbal = GimbalController
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names are imported lazily on first access (PEP 562) so that
+# ``import dronesdk`` does not pull in every submodule and pymavlink.
+# Values are "module" or "module:attribute" when the names differ.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Core infrastructure
+    "APIException": "dronesdk.core.exceptions",
+    "TimeoutError": "dronesdk.core.exceptions",
+    "HasObservers": "dronesdk.core.observer",
+    "EventBus": "dronesdk.core.events",
+    "EventPriority": "dronesdk.core.events",
+    "MAVLinkMessageEvent": "dronesdk.core.events",
+    "Subscription": "dronesdk.core.events",
+    "Observable": "dronesdk.core.types",
+    "VehicleModule": "dronesdk.core.types",
+    "ConnectionProtocol": "dronesdk.core.types",
+    # Data models
+    "LocationGlobal": "dronesdk.models.location",
+    "LocationGlobalRelative": "dronesdk.models.location",
+    "LocationLocal": "dronesdk.models.location",
+    "Attitude": "dronesdk.models.attitude",
+    "Battery": "dronesdk.models.battery",
+    "GPSInfo": "dronesdk.models.sensors",
+    "Rangefinder": "dronesdk.models.sensors",
+    "Wind": "dronesdk.models.sensors",
+    "Version": "dronesdk.models.version",
+    "Capabilities": "dronesdk.models.version",
+    "VehicleMode": "dronesdk.models.status",
+    "SystemStatus": "dronesdk.models.status",
+    "Command": "dronesdk.models.command",
+    # Data link
+    "MAVConnection": "dronesdk.datalink.connection",
+    "MAVWriter": "dronesdk.datalink.connection",
+    "HeartbeatManager": "dronesdk.datalink.heartbeat",
+    "VehicleHeartbeatEvent": "dronesdk.datalink.heartbeat",
+    "VehicleHeartbeatFilter": "dronesdk.datalink.heartbeat",
+    "MessageRouter": "dronesdk.datalink.message_router",
+    # Modules
+    "SensorManager": "dronesdk.sensors.manager",
+    "Locations": "dronesdk.sensors.location",
+    "BatteryMonitor": "dronesdk.power.monitor",
+    "HealthMonitor": "dronesdk.health.monitor",
+    "EKFStatus": "dronesdk.health.monitor",
+    "ParameterManager": "dronesdk.parameters.manager",
+    "Channels": "dronesdk.channels.reader",
+    "ChannelsOverride": "dronesdk.channels.override",
+    "GimbalController": "dronesdk.gimbal.controller",
+    "GimbalState": "dronesdk.gimbal.controller",
+    "CommandSequence": "dronesdk.mission.sequence",
+    "MissionManager": "dronesdk.mission.manager",
+    "FlightController": "dronesdk.flight_control.controller",
+    "get_distance_metres": "dronesdk.flight_control.navigation",
+    "get_location_metres": "dronesdk.flight_control.navigation",
+    "get_bearing": "dronesdk.flight_control.navigation",
+    # Logging utilities (from original util.py for backwards compatibility)
+    "ErrprinterHandler": "dronesdk.util",
+    # Compatibility layer (main public API)
+    "Vehicle": "dronesdk.compat.facade",
+    "connect": "dronesdk.compat.connect",
+    # Re-export pymavlink for convenience
+    "mavutil": "pymavlink:mavutil",
+    # Legacy aliases for the Parameters and Gimbal classes
+    "Parameters": "dronesdk.parameters.manager:ParameterManager",
+    "Gimbal": "dronesdk.gimbal.controller:GimbalController",
+}
+
+if TYPE_CHECKING:
+    from pymavlink import mavutil
+
+    from dronesdk.channels.override import ChannelsOverride
+    from dronesdk.channels.reader import Channels
+    from dronesdk.compat.connect import connect
+    from dronesdk.compat.facade import Vehicle
+    from dronesdk.core.events import (
+        EventBus,
+        EventPriority,
+        MAVLinkMessageEvent,
+        Subscription,
+    )
+    from dronesdk.core.exceptions import APIException, TimeoutError
+    from dronesdk.core.observer import HasObservers
+    from dronesdk.core.types import ConnectionProtocol, Observable, VehicleModule
+    from dronesdk.datalink.connection import MAVConnection, MAVWriter
+    from dronesdk.datalink.heartbeat import (
+        HeartbeatManager,
+        VehicleHeartbeatEvent,
+        VehicleHeartbeatFilter,
+    )
+    from dronesdk.datalink.message_router import MessageRouter
+    from dronesdk.flight_control.controller import FlightController
+    from dronesdk.flight_control.navigation import (
+        get_bearing,
+        get_distance_metres,
+        get_location_metres,
+    )
+    from dronesdk.gimbal.controller import GimbalController, GimbalState
+    from dronesdk.health.monitor import EKFStatus, HealthMonitor
+    from dronesdk.mission.manager import MissionManager
+    from dronesdk.mission.sequence import CommandSequence
+    from dronesdk.models.attitude import Attitude
+    from dronesdk.models.battery import Battery
+    from dronesdk.models.command import Command
+    from dronesdk.models.location import (
+        LocationGlobal,
+        LocationGlobalRelative,
+        LocationLocal,
+    )
+    from dronesdk.models.sensors import GPSInfo, Rangefinder, Wind
+    from dronesdk.models.status import SystemStatus, VehicleMode
+    from dronesdk.models.version import Capabilities, Version
+    from dronesdk.parameters.manager import ParameterManager
+    from dronesdk.power.monitor import BatteryMonitor
+    from dronesdk.sensors.location import Locations
+    from dronesdk.sensors.manager import SensorManager
+    from dronesdk.util import ErrprinterHandler
+
+    Parameters = ParameterManager
+    Gimbal = GimbalController
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    try:
+        target = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module_name, _, attr = target.partition(":")
+    value = getattr(importlib.import_module(module_name), attr or name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Main API
@@ -138,11 +219,14 @@ __all__ = [
     "MAVConnection",
     "MAVWriter",
     "HeartbeatManager",
+    "VehicleHeartbeatEvent",
+    "VehicleHeartbeatFilter",
     "MessageRouter",
     # Event system
     "EventBus",
     "EventPriority",
     "MAVLinkMessageEvent",
+    "Subscription",
     # Types
     "Observable",
     "VehicleModule",
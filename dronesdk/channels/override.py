@@ -7,6 +7,8 @@ This module provides RC channel override functionality.
 from __future__ import annotations
 
 import logging
+from array import array
+from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Any, Iterator
 
 if TYPE_CHECKING:
@@ -14,13 +16,38 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# RC_CHANNELS_OVERRIDE carries channels 1-8
+_OVERRIDE_CHANNELS = 8
+# Largest value an override field (uint16) can carry
+_MAX_PWM = 0xFFFF
 
-class ChannelsOverride(dict):
+
+def _to_pwm(channel: int, value: int | float | None) -> int:
     """
-    A dictionary class for managing vehicle channel overrides.
+    Convert an override value to the integer sent to the vehicle.
+
+    Returns:
+        The PWM value, or 0 for a falsy value (release the channel)
+
+    Raises:
+        ValueError: If the value does not fit the override field
+    """
+    if not value:
+        return 0
+    pwm = int(value)
+    if not 0 < pwm <= _MAX_PWM:
+        raise ValueError(f"Invalid override value {value!r} for channel {channel}")
+    return pwm
+
+
+class ChannelsOverride(MutableMapping):
+    """
+    A mapping class for managing vehicle channel overrides.
 
     Channels can be read, written, or cleared by index or using
     dictionary syntax. To clear a value, set it to None or use del.
+    Only overridden channels are keys, and len() counts them. Values are
+    stored as integers; floats are truncated.
 
     The override values are sent to the vehicle when any change is made.
 
@@ -31,64 +58,104 @@ class ChannelsOverride(dict):
         >>> vehicle.channels.overrides = {}  # Clear all
     """
 
-    __slots__ = ("_connection", "_count", "_active")
+    __slots__ = ("_connection", "_count", "_active", "_last_sent", "_buf", "_mask")
 
     def __init__(self, connection: "MAVConnection | None" = None) -> None:
-        super().__init__()
         self._connection = connection
-        self._count = 8  # Fixed by MAVLink
+        self._count = _OVERRIDE_CHANNELS  # Fixed by MAVLink
         self._active = True
+        # Override values indexed by channel - 1 (0 = released)
+        self._buf = array("H", [0] * self._count)
+        # Bit (channel - 1) is set for every overridden channel
+        self._mask = 0
+        # Last override values sent, used to suppress duplicate sends
+        self._last_sent: tuple[int, ...] | None = None
 
     def set_connection(self, connection: "MAVConnection") -> None:
         """Set the MAVLink connection for sending overrides."""
         self._connection = connection
+        self._last_sent = None
+
+    def _index(self, key: str | int) -> int:
+        """Convert a key to the buffer index of an active override."""
+        try:
+            index = int(key) - 1
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        if not (0 <= index < self._count) or not self._buf[index]:
+            raise KeyError(key)
+        return index
 
     def __getitem__(self, key: str | int) -> int:
         """Get an override value by channel number."""
-        return dict.__getitem__(self, str(key))
+        return self._buf[self._index(key)]
 
     def __setitem__(self, key: str | int, value: int | None) -> None:
         """Set or clear an override value."""
-        channel = int(key)
-        if not (0 < channel <= self._count):
+        channel = key if type(key) is int else int(key)
+        # Single check for channel < 1 or channel > 8
+        if (channel - 1) & ~(_OVERRIDE_CHANNELS - 1):
             raise KeyError(f"Invalid channel index {key}")
 
-        if not value:
-            # Clear override
-            try:
-                dict.__delitem__(self, str(key))
-            except KeyError:
-                pass
-        else:
-            dict.__setitem__(self, str(key), value)
-
+        self._store(channel, _to_pwm(channel, value))
         self._send()
 
     def __delitem__(self, key: str | int) -> None:
         """Clear an override value."""
-        dict.__delitem__(self, str(key))
+        self._store(self._index(key) + 1, 0)
         self._send()
 
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the overridden channel numbers as strings."""
+        buf = self._buf
+        return (str(i + 1) for i in range(self._count) if buf[i])
+
     def __len__(self) -> int:
-        """Return the number of channels (always 8)."""
-        return self._count
+        """Return the number of overridden channels."""
+        return bin(self._mask).count("1")
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def _active_channels(self) -> dict[int, int]:
+        """Return the active overrides keyed by integer channel number."""
+        buf = self._buf
+        return {i + 1: buf[i] for i in range(self._count) if buf[i]}
+
+    def _store(self, channel: int, pwm: int) -> None:
+        """Set an override, or clear it when `pwm` is 0, without sending."""
+        self._buf[channel - 1] = pwm
+        if pwm:
+            self._mask |= 1 << (channel - 1)
+        else:
+            self._mask &= ~(1 << (channel - 1))
+
+    def clear(self) -> None:
+        """Clear all overrides without sending."""
+        for i in range(self._count):
+            self._buf[i] = 0
+        self._mask = 0
 
     def _send(self) -> None:
         """Send the current overrides to the vehicle."""
         if not self._active or not self._connection:
             return
 
-        overrides = [0] * 8
-        for k, v in self.items():
-            overrides[int(k) - 1] = v
+        overrides = tuple(self._buf)
+
+        # Skip the send if the vehicle already has these values
+        if overrides == self._last_sent:
+            return
 
         self._connection.master.mav.rc_channels_override_send(0, 0, *overrides)
+        self._last_sent = overrides
 
     def clear_all(self) -> None:
         """Clear all overrides."""
         self._active = False
-        dict.clear(self)
+        self.clear()
         self._active = True
+        self._last_sent = None
         self._send()
 
 
@@ -126,7 +193,7 @@ class ChannelsOverrideManager:
         Args:
             channel: Channel number (1-8)
         """
-        if str(channel) in self._overrides:
+        if channel > 0 and (self._overrides._mask >> (channel - 1)) & 1:
             del self._overrides[channel]
 
     def clear_all(self) -> None:
@@ -137,18 +204,32 @@ class ChannelsOverrideManager:
         """
         Set multiple overrides at once.
 
+        All changes are applied to the override buffer first and sent
+        to the vehicle in a single RC_CHANNELS_OVERRIDE message.
+
         Args:
             overrides: Dictionary mapping channel numbers to values.
                       Use None to clear an override.
+
+        Raises:
+            KeyError: If any channel is outside 1-8; no override is changed
+            ValueError: If any value does not fit an override field; no
+                override is changed
         """
+        # Check every channel and value first so a bad one changes nothing
+        changes = []
+        for key, value in overrides.items():
+            channel = int(key)
+            if (channel - 1) & ~(_OVERRIDE_CHANNELS - 1):
+                raise KeyError(f"Invalid channel index {channel}")
+            changes.append((channel, _to_pwm(channel, value)))
+
         self._overrides._active = False
-        for channel, value in overrides.items():
-            if value is None:
-                if str(channel) in self._overrides:
-                    dict.__delitem__(self._overrides, str(channel))
-            else:
-                dict.__setitem__(self._overrides, str(channel), value)
-        self._overrides._active = True
+        try:
+            for channel, value in changes:
+                self._overrides._store(channel, value)
+        finally:
+            self._overrides._active = True
         self._overrides._send()
 
     def get(self, channel: int) -> int | None:
@@ -161,7 +242,7 @@ class ChannelsOverrideManager:
         Returns:
             Override value or None if not set
         """
-        return self._overrides.get(str(channel))
+        return self._overrides.get(channel)
 
     @property
     def overrides(self) -> ChannelsOverride:
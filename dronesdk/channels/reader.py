@@ -7,9 +7,11 @@ This module provides RC channel reading functionality.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Iterator
+import operator
+from typing import TYPE_CHECKING, Any, Callable
 
 from dronesdk.channels.override import ChannelsOverride
+from dronesdk.core.events import EventPriority
 
 if TYPE_CHECKING:
     from dronesdk.core.events import EventBus, MAVLinkMessageEvent
@@ -17,6 +19,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# RC_CHANNELS_RAW carries channels 1-8, RC_CHANNELS carries channels 1-18
+_RAW_CHAN_ATTRS = tuple(f"chan{i}_raw" for i in range(1, 9))
+_RAW_CHAN_GETTER = operator.attrgetter(*_RAW_CHAN_ATTRS)
+_CHAN_ATTRS = tuple(f"chan{i}_raw" for i in range(1, 19))
+_CHAN_GETTER = operator.attrgetter(*_CHAN_ATTRS)
+# Channel keys "1".."18", indexed by channel - 1, so reads and telemetry
+# updates do not allocate a new key string per channel
+_CHAN_KEYS = tuple(str(i) for i in range(1, len(_CHAN_ATTRS) + 1))
+_RAW_CHAN_KEYS = _CHAN_KEYS[: len(_RAW_CHAN_ATTRS)]
+
+
+def _channel_key(key: str | int) -> str:
+    """Convert a channel number to its string key."""
+    if type(key) is int and 0 < key <= len(_CHAN_KEYS):
+        return _CHAN_KEYS[key - 1]
+    return str(key)
+
 
 class Channels(dict):
     """
@@ -31,7 +50,17 @@ class Channels(dict):
         >>> vehicle.channels.overrides['3'] = 1600  # Override channel 3
     """
 
-    __slots__ = ("_connection", "_count", "_overrides", "_readonly", "_unsubscribe")
+    __slots__ = (
+        "_connection",
+        "_count",
+        "_overrides",
+        "_readonly",
+        "_unsubscribe_fns",
+    )
+
+    # Telemetry updates write through these, bypassing the read-only guard
+    _raw_update = dict.__setitem__
+    _raw_update_many = dict.update
 
     def __init__(
         self,
@@ -42,12 +71,10 @@ class Channels(dict):
         self._connection = connection
         self._count = count
         self._overrides = ChannelsOverride(connection)
-        self._unsubscribe: Callable[[], None] | None = None
+        self._unsubscribe_fns: list[Callable[[], None]] = []
 
         # Initialize with None values
-        self._readonly = False
-        for k in range(count):
-            self[k + 1] = None
+        self._raw_update_many(dict.fromkeys(map(_channel_key, range(1, count + 1))))
         self._readonly = True
 
     def set_connection(self, connection: "MAVConnection") -> None:
@@ -67,22 +94,33 @@ class Channels(dict):
         Args:
             event_bus: The event bus to subscribe to
         """
-        self._unsubscribe = event_bus.subscribe_message(
+        unsub1 = event_bus.subscribe_message(
             "RC_CHANNELS_RAW",
             self._handle_rc_channels,
+            priority=EventPriority.HIGH,
         )
         # Also subscribe to RC_CHANNELS for newer protocol
-        event_bus.subscribe_message(
+        unsub2 = event_bus.subscribe_message(
             "RC_CHANNELS",
             self._handle_rc_channels_new,
+            priority=EventPriority.HIGH,
         )
+        self._unsubscribe_fns = [unsub1, unsub2]
         logger.debug("Channels attached to event bus")
 
     def detach(self) -> None:
-        """Detach from the event bus."""
-        if self._unsubscribe:
-            self._unsubscribe()
-            self._unsubscribe = None
+        """
+        Detach from the event bus.
+
+        Releases any active overrides and forgets the last channel values.
+        The channel keys are kept, so a later attach reuses them.
+        """
+        for unsub in self._unsubscribe_fns:
+            unsub()
+        self._unsubscribe_fns.clear()
+        self._overrides.clear_all()
+
+        self._raw_update_many(dict.fromkeys(self.keys()))
         logger.debug("Channels detached from event bus")
 
     def initialize(self) -> None:
@@ -93,21 +131,57 @@ class Channels(dict):
         """Handle RC_CHANNELS_RAW message."""
         msg = event.message
         # Update channels 1-8
-        for i in range(1, 9):
-            value = getattr(msg, f"chan{i}_raw", None)
-            if value is not None:
-                self._update_channel(i, value)
+        try:
+            values = _RAW_CHAN_GETTER(msg)
+        except AttributeError:
+            values = [getattr(msg, attr, None) for attr in _RAW_CHAN_ATTRS]
+        if None not in values:
+            self._grow(len(values))
+            self._raw_update_many(zip(_RAW_CHAN_KEYS, values))
+        else:
+            updates = [
+                (key, value)
+                for key, value in zip(_RAW_CHAN_KEYS, values)
+                if value is not None
+            ]
+            if updates:
+                self._grow(int(updates[-1][0]))
+                self._raw_update_many(updates)
 
     def _handle_rc_channels_new(self, event: "MAVLinkMessageEvent") -> None:
         """Handle RC_CHANNELS message (newer protocol)."""
         msg = event.message
         # Update all available channels
-        for i in range(1, 19):
-            attr = f"chan{i}_raw"
-            if hasattr(msg, attr):
-                value = getattr(msg, attr)
-                if value != 65535:  # 65535 = not available
-                    self._update_channel(i, value)
+        try:
+            values = _CHAN_GETTER(msg)
+        except AttributeError:
+            values = [getattr(msg, attr, 65535) for attr in _CHAN_ATTRS]
+        if 65535 not in values:  # 65535 = not available
+            # Every channel is valid: store them all in one update
+            self._grow(len(values))
+            self._raw_update_many(zip(_CHAN_KEYS, values))
+        else:
+            updates = [
+                (key, value)
+                for key, value in zip(_CHAN_KEYS, values)
+                if value != 65535
+            ]
+            if updates:
+                self._grow(int(updates[-1][0]))
+                self._raw_update_many(updates)
+
+    def _grow(self, count: int) -> None:
+        """
+        Extend the channel count, adding the new channels as None.
+
+        Channels are only ever added here, in ascending order, so the dict
+        keys stay in channel order.
+        """
+        if count > self._count:
+            self._raw_update_many(
+                dict.fromkeys(map(_channel_key, range(self._count + 1, count + 1)))
+            )
+            self._count = count
 
     @property
     def count(self) -> int:
@@ -116,29 +190,35 @@ class Channels(dict):
 
     def __getitem__(self, key: str | int) -> int | None:
         """Get a channel value by number."""
-        return dict.__getitem__(self, str(key))
+        return dict.__getitem__(self, _channel_key(key))
 
     def __setitem__(self, key: str | int, value: int | None) -> None:
         """Set a channel value (only allowed internally)."""
         if self._readonly:
             raise TypeError("Channel values are read-only")
-        return dict.__setitem__(self, str(key), value)
+        self._update_channel(int(key), value)
 
     def __len__(self) -> int:
         """Return the number of channels."""
         return self._count
 
-    def _update_channel(self, channel: int, value: int) -> None:
+    def __contains__(self, key: object) -> bool:
+        """Check whether a channel number is available."""
+        return dict.__contains__(self, _channel_key(key))  # type: ignore[arg-type]
+
+    def get(self, key: str | int, default: Any = None) -> Any:
+        """Get a channel value, or `default` if the channel is unknown."""
+        return dict.get(self, _channel_key(key), default)
+
+    def _update_channel(self, channel: int, value: int | None) -> None:
         """
         Update a channel value (internal use).
 
         Expands the channel count if necessary.
         """
         channel = int(channel)
-        self._readonly = False
-        self[channel] = value
-        self._readonly = True
-        self._count = max(self._count, channel)
+        self._grow(channel)
+        self._raw_update(_channel_key(channel), value)
 
     @property
     def overrides(self) -> ChannelsOverride:
@@ -159,20 +239,25 @@ class Channels(dict):
     @overrides.setter
     def overrides(self, newch: dict[str | int, int | None]) -> None:
         """Set multiple overrides at once."""
+        # Nothing to do if the vehicle already has exactly these overrides
+        if {int(k): v for k, v in newch.items() if v} == (
+            self._overrides._active_channels()
+        ):
+            return
+
         self._overrides._active = False
-        self._overrides.clear()
-        for k, v in newch.items():
-            if v:
-                self._overrides[str(k)] = v
-            else:
-                try:
-                    del self._overrides[str(k)]
-                except KeyError:
-                    pass
-        self._overrides._active = True
+        try:
+            self._overrides.clear()
+            for k, v in newch.items():
+                # Falsy values are releases, already applied by clear()
+                if v:
+                    self._overrides[k] = v
+        finally:
+            self._overrides._active = True
         self._overrides._send()
 
     def __str__(self) -> str:
         """Return string representation of channel values."""
-        values = [f"{k}:{v}" for k, v in sorted(self.items(), key=lambda x: int(x[0]))]
+        # Keys are kept in channel order, see _grow()
+        values = [f"{k}:{v}" for k, v in self.items()]
         return f"Channels({', '.join(values)})"
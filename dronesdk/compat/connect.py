@@ -8,20 +8,78 @@ vehicle connections.
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 
-import monotonic
+from pymavlink import mavutil
 
 from dronesdk.compat.facade import Vehicle
 from dronesdk.core.exceptions import APIException, TimeoutError
 from dronesdk.datalink.connection import MAVConnection
+from dronesdk.datalink.heartbeat import _IGNORED_HB_TYPES
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Shortest still_waiting_interval honoured, so a zero or negative one
+# does not turn the heartbeat wait into a busy loop (seconds)
+_MIN_STILL_WAITING_INTERVAL = 0.01
+
+_MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES = (
+    mavutil.mavlink.MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES
+)
+_MAV_CMD_SET_MESSAGE_INTERVAL = mavutil.mavlink.MAV_CMD_SET_MESSAGE_INTERVAL
+
+# Autopilots known to honour MAV_CMD_SET_MESSAGE_INTERVAL
+_MESSAGE_INTERVAL_AUTOPILOTS = frozenset(
+    (
+        mavutil.mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA,
+        mavutil.mavlink.MAV_AUTOPILOT_PX4,
+    )
+)
+
+# Streamed messages the vehicle modules subscribe to, with their rate
+# multiplier relative to the requested telemetry rate. Keep in sync with
+# the modules' subscriptions; other messages only arrive through the
+# legacy data stream request. Messages missing from the loaded dialect
+# (e.g. ArduPilot-only ones under common) are skipped.
+_MESSAGE_INTERVALS = tuple(
+    (getattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{name}"), multiplier)
+    for name, multiplier in (
+        ("ATTITUDE", 1),
+        ("GLOBAL_POSITION_INT", 2),
+        ("LOCAL_POSITION_NED", 2),
+        ("GPS_RAW_INT", 1),
+        ("SYS_STATUS", 1),
+        ("VFR_HUD", 1),
+        ("RC_CHANNELS", 1),
+        ("RC_CHANNELS_RAW", 1),
+        ("EKF_STATUS_REPORT", 1),
+        ("RANGEFINDER", 1),
+        ("WIND", 1),
+        ("MOUNT_STATUS", 1),
+        ("MOUNT_ORIENTATION", 1),
+        ("MISSION_CURRENT", 1),
+    )
+    if hasattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{name}")
+)
+
+# Legacy MAV_DATA_STREAM ids, with their rate multiplier relative to
+# the requested telemetry rate
+_DATA_STREAMS = (
+    (1, 2),  # RAW_SENSORS
+    (2, 1),  # EXTENDED_STATUS
+    (3, 1),  # RC_CHANNELS
+    (4, 1),  # RAW_CONTROLLER
+    (6, 2),  # POSITION
+    (10, 1),  # EXTRA1 (attitude)
+    (11, 1),  # EXTRA2 (VFR_HUD)
+    (12, 1),  # EXTRA3
+)
+
 
 def connect(
     ip: str,
@@ -90,48 +148,53 @@ def connect(
     handler.start()
 
     # Add heartbeat listener to detect target system
-    from pymavlink import mavutil
+    heartbeat_cond = threading.Condition()
+    autopilot_type: int | None = None
 
     def _heartbeat_listener(_: Any, msg: Any) -> None:
         """Update target system when heartbeat is received."""
-        if msg.get_type() == "HEARTBEAT":
-            # Ignore non-vehicle heartbeats
-            if msg.type not in (
-                mavutil.mavlink.MAV_TYPE_GCS,
-                mavutil.mavlink.MAV_TYPE_GIMBAL,
-                mavutil.mavlink.MAV_TYPE_ADSB,
-                mavutil.mavlink.MAV_TYPE_ONBOARD_CONTROLLER,
-            ):
-                if handler.target_system == 0:
-                    handler.target_system = msg.get_srcSystem()
-                    handler.master.target_system = msg.get_srcSystem()
-                    handler.master.target_component = msg.get_srcComponent()
-
-    handler.forward_message(_heartbeat_listener)
-
-    # Wait for heartbeat
+        nonlocal autopilot_type
+        # Ignore non-vehicle heartbeats
+        if msg.type not in _IGNORED_HB_TYPES:
+            if handler.target_system == 0:
+                handler.target_system = msg.get_srcSystem()
+                handler.master.target_system = msg.get_srcSystem()
+                handler.master.target_component = msg.get_srcComponent()
+                autopilot_type = msg.autopilot
+                with heartbeat_cond:
+                    heartbeat_cond.notify_all()
+
+    handler.forward_message(_heartbeat_listener, msg_type="HEARTBEAT")
+
+    # Wait for heartbeat; the listener wakes us as soon as one arrives
     logger.info("Connecting to vehicle on: %s", ip)
-    start = monotonic.monotonic()
+    start = time.monotonic()
+    deadline = start + heartbeat_timeout
     last_callback = start
+    interval = max(still_waiting_interval, _MIN_STILL_WAITING_INTERVAL)
 
-    while True:
-        # Check for heartbeat
-        if handler.target_system != 0:
+    while handler.target_system == 0:
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
             break
 
-        # Check timeout
-        if (monotonic.monotonic() - start) > heartbeat_timeout:
-            handler.close()
-            raise TimeoutError(f"No heartbeat received in {heartbeat_timeout}s")
-
-        # Still waiting callback
+        # Still waiting callback, called without the condition held: the
+        # heartbeat listener takes it on the shared input thread
         if still_waiting_callback:
-            now = monotonic.monotonic()
-            if (now - last_callback) >= still_waiting_interval:
+            if (now - last_callback) >= interval:
                 still_waiting_callback(handler)
                 last_callback = now
+            remaining = min(remaining, interval - (now - last_callback))
 
-        time.sleep(0.1)
+        with heartbeat_cond:
+            # Checked under the condition so a heartbeat is not missed
+            if handler.target_system == 0:
+                heartbeat_cond.wait(remaining)
+
+    if handler.target_system == 0:
+        handler.close()
+        raise TimeoutError(f"No heartbeat received in {heartbeat_timeout}s")
 
     logger.info(
         "Connected to vehicle (system %d, component %d)",
@@ -142,8 +205,12 @@ def connect(
     # Create vehicle
     vehicle = Vehicle(handler)
 
-    # Request data streams
+    # Request telemetry. The data streams cover every message, including
+    # those only user listeners want; autopilots that support it then get
+    # exact intervals for the messages the modules consume.
     _request_data_streams(handler, rate)
+    if autopilot_type in _MESSAGE_INTERVAL_AUTOPILOTS:
+        _request_message_intervals(handler, rate)
 
     # Request autopilot version/capabilities
     _request_autopilot_capabilities(handler)
@@ -167,12 +234,10 @@ def connect(
 
 def _request_autopilot_capabilities(handler: MAVConnection) -> None:
     """Request autopilot version and capabilities."""
-    from pymavlink import mavutil
-
     handler.master.mav.command_long_send(
         handler.target_system,
         handler.master.target_component,
-        mavutil.mavlink.MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES,
+        _MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES,
         0,  # confirmation
         1,  # request (1 = request)
         0,
@@ -184,34 +249,39 @@ def _request_autopilot_capabilities(handler: MAVConnection) -> None:
     )
 
 
+def _request_message_intervals(handler: MAVConnection, rate: int) -> None:
+    """Request the telemetry messages used by dronesdk at fixed intervals."""
+    send = handler.master.mav.command_long_send
+    target_system = handler.target_system
+    target_component = handler.master.target_component
+
+    for message_id, multiplier in _MESSAGE_INTERVALS:
+        # Interval in microseconds; -1 disables the message
+        interval_us = int(1e6 / (rate * multiplier)) if rate > 0 else -1
+        send(
+            target_system,
+            target_component,
+            _MAV_CMD_SET_MESSAGE_INTERVAL,
+            0,  # confirmation
+            message_id,
+            interval_us,
+            0,
+            0,
+            0,
+            0,
+            0,
+        )
+
+
 def _request_data_streams(handler: MAVConnection, rate: int) -> None:
-    """Request data streams from the vehicle."""
+    """Request data streams from the vehicle (legacy REQUEST_DATA_STREAM)."""
+    send = handler.master.mav.request_data_stream_send
+    target_system = handler.target_system
+    target_component = handler.master.target_component
+
     # Request all data streams
-    handler.master.mav.request_data_stream_send(
-        handler.target_system,
-        handler.master.target_component,
-        0,  # MAV_DATA_STREAM_ALL
-        rate,
-        1,  # start
-    )
+    send(target_system, target_component, 0, rate, 1)  # MAV_DATA_STREAM_ALL, start
 
     # Request specific streams at higher rates for important data
-    streams = [
-        (1, rate * 2),  # RAW_SENSORS
-        (2, rate),  # EXTENDED_STATUS
-        (3, rate),  # RC_CHANNELS
-        (4, rate),  # RAW_CONTROLLER
-        (6, rate * 2),  # POSITION
-        (10, rate),  # EXTRA1 (attitude)
-        (11, rate),  # EXTRA2 (VFR_HUD)
-        (12, rate),  # EXTRA3
-    ]
-
-    for stream_id, stream_rate in streams:
-        handler.master.mav.request_data_stream_send(
-            handler.target_system,
-            handler.master.target_component,
-            stream_id,
-            stream_rate,
-            1,
-        )
+    for stream_id, multiplier in _DATA_STREAMS:
+        send(target_system, target_component, stream_id, rate * multiplier, 1)
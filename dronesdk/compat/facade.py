@@ -8,23 +8,17 @@ and maintains backwards compatibility with the original API.
 from __future__ import annotations
 
 import logging
-import time
+import threading
+from collections import defaultdict
+from time import monotonic as _monotonic
 from typing import TYPE_CHECKING, Any, Callable
 
-import monotonic
 from pymavlink import mavutil
 
-from dronesdk.core.events import EventBus
+from dronesdk.core.events import AttributeChangedEvent, EventBus, EventPriority
 from dronesdk.core.exceptions import APIException, TimeoutError
 from dronesdk.core.observer import HasObservers
-from dronesdk.channels.reader import Channels
-from dronesdk.datalink.connection import MAVConnection
-from dronesdk.datalink.heartbeat import HeartbeatManager
 from dronesdk.datalink.message_router import LegacyMessageAdapter, MessageRouter
-from dronesdk.flight_control.controller import FlightController
-from dronesdk.gimbal.controller import GimbalController
-from dronesdk.health.monitor import HealthMonitor
-from dronesdk.mission.sequence import CommandSequence
 from dronesdk.models.attitude import Attitude
 from dronesdk.models.battery import Battery
 from dronesdk.models.location import (
@@ -35,16 +29,21 @@ from dronesdk.models.location import (
 from dronesdk.models.sensors import GPSInfo, Rangefinder, Wind
 from dronesdk.models.status import SystemStatus, VehicleMode
 from dronesdk.models.version import Capabilities, Version
-from dronesdk.parameters.manager import ParameterManager
-from dronesdk.power.monitor import BatteryMonitor
-from dronesdk.sensors.location import Locations
-from dronesdk.sensors.manager import SensorManager
 
 if TYPE_CHECKING:
-    from dronesdk.gimbal.controller import GimbalState
+    from dronesdk.channels.reader import Channels
+    from dronesdk.datalink.connection import MAVConnection
+    from dronesdk.gimbal.controller import GimbalController, GimbalState
+    from dronesdk.mission.sequence import CommandSequence
+    from dronesdk.parameters.manager import ParameterManager
+    from dronesdk.sensors.location import Locations
 
 logger = logging.getLogger(__name__)
 
+# Longest wait_ready() sleeps before re-checking an attribute whose
+# updates do not signal a ready event
+_READY_POLL_INTERVAL = 0.1
+
 
 class Vehicle(HasObservers):
     """
@@ -53,6 +52,11 @@ class Vehicle(HasObservers):
     This class composes all the modular components and provides
     a backwards-compatible API matching the original dronesdk.
 
+    Attributes:
+        message_factory: MAVLink message factory used to build messages
+        send_mavlink: Send a MAVLink message, e.g.
+            ``vehicle.send_mavlink(vehicle.message_factory.xxx_encode(...))``
+
     Example:
         >>> from dronesdk import connect
         >>> vehicle = connect('127.0.0.1:14550', wait_ready=True)
@@ -63,11 +67,39 @@ class Vehicle(HasObservers):
         >>> vehicle.simple_takeoff(10)
     """
 
+    __slots__ = (
+        "_handler",
+        "_master",
+        "message_factory",
+        "send_mavlink",
+        "_event_bus",
+        "_message_router",
+        "_legacy_adapter",
+        "_heartbeat_filter",
+        "_heartbeat",
+        "_flight_control",
+        "_sensors",
+        "_location",
+        "_battery_monitor",
+        "_health",
+        "_parameters",
+        "_channels",
+        "_gimbal",
+        "_commands",
+        "_home_location",
+        "_ready_events",
+        "_params_map",
+    )
+
     def __init__(self, handler: MAVConnection) -> None:
         super().__init__()
         self._handler = handler
         self._master = handler.master
 
+        # Bound once: the master link must not be replaced after construction
+        self.message_factory = self._master.mav
+        self.send_mavlink = self._master.mav.send
+
         # Create event bus
         self._event_bus = EventBus()
 
@@ -78,14 +110,28 @@ class Vehicle(HasObservers):
         # Legacy message adapter for on_message()
         self._legacy_adapter = LegacyMessageAdapter(self._event_bus)
 
-        # Create modules
-        self._heartbeat = HeartbeatManager()
-        self._flight_control = FlightController(
-            on_mode_change=self._on_mode_change,
-            on_armed_change=self._on_armed_change,
+        # Create modules. They are imported here rather than at module
+        # level so importing the facade stays cheap until a Vehicle is built.
+        from dronesdk.channels.reader import Channels
+        from dronesdk.datalink.heartbeat import (
+            HeartbeatManager,
+            VehicleHeartbeatFilter,
         )
+        from dronesdk.flight_control.controller import FlightController
+        from dronesdk.gimbal.controller import GimbalController
+        from dronesdk.health.monitor import HealthMonitor
+        from dronesdk.mission.sequence import CommandSequence
+        from dronesdk.parameters.manager import ParameterManager
+        from dronesdk.power.monitor import BatteryMonitor
+        from dronesdk.sensors.location import Locations
+        from dronesdk.sensors.manager import SensorManager
+
+        self._heartbeat_filter = VehicleHeartbeatFilter()
+        self._heartbeat = HeartbeatManager()
+        self._flight_control = FlightController()
         self._sensors = SensorManager(
             on_attitude_update=self._on_attitude_update,
+            on_gps_update=self._on_gps_update,
         )
         self._location = Locations()
         self._battery_monitor = BatteryMonitor(
@@ -105,9 +151,17 @@ class Vehicle(HasObservers):
         self._gimbal.set_connection(handler)
         self._commands.set_connection(handler)
 
-        # Attach modules to event bus
-        self._heartbeat.attach(self._event_bus)
-        self._flight_control.attach(self._event_bus)
+        # Mode and armed changes arrive as attribute events on the bus
+        for name in ("mode", "armed"):
+            self._event_bus.subscribe_attribute(
+                name, self._on_state_change, priority=EventPriority.HIGH
+            )
+
+        # Attach modules to event bus. Vehicle heartbeats are filtered and
+        # decoded once, then shared by the heartbeat and flight modules.
+        self._heartbeat_filter.attach(self._event_bus)
+        self._heartbeat.attach(self._event_bus, self._heartbeat_filter)
+        self._flight_control.attach(self._event_bus, self._heartbeat_filter)
         self._sensors.attach(self._event_bus)
         self._location.attach(self._event_bus)
         self._battery_monitor.attach(self._event_bus)
@@ -123,30 +177,46 @@ class Vehicle(HasObservers):
         # Home location cache
         self._home_location: LocationGlobal | None = None
 
+        # Set when an attribute first gets a value, to wake wait_ready()
+        self._ready_events: defaultdict[str, threading.Event] = defaultdict(
+            threading.Event
+        )
+        self._ready_events["parameters"] = self._parameters._wait_ready_event
+
         # For backwards compatibility
         self._params_map: dict[str, float] = self._parameters._params
 
     # ===== Callbacks for attribute notifications =====
 
-    def _on_mode_change(self, mode: VehicleMode) -> None:
-        """Handle mode change from flight controller."""
-        self.notify_attribute_listeners("mode", mode, cache=True)
-
-    def _on_armed_change(self, armed: bool) -> None:
-        """Handle armed change from flight controller."""
-        self.notify_attribute_listeners("armed", armed, cache=True)
+    def _on_state_change(self, event: AttributeChangedEvent) -> None:
+        """Handle a mode or armed change published by the flight controller."""
+        name = event.attribute_name
+        # The controller only publishes real changes. The first value is
+        # not a change for listeners, but it does make the attribute ready.
+        if event.old_value is not None:
+            self.notify_attribute_listeners(name, event.new_value)
+        self._ready_events[name].set()
 
     def _on_attitude_update(self, attitude: Attitude) -> None:
         """Handle attitude update from sensors."""
-        self.notify_attribute_listeners("attitude", attitude)
+        # Skip repeats of the previous reading
+        self.notify_attribute_listeners("attitude", attitude, cache=True)
+        self._ready_events["attitude"].set()
+
+    def _on_gps_update(self, gps: GPSInfo) -> None:
+        """Handle GPS update from sensors."""
+        self._ready_events["gps_0"].set()
 
     def _on_battery_update(self, battery: Battery) -> None:
         """Handle battery update."""
-        self.notify_attribute_listeners("battery", battery)
+        self.notify_attribute_listeners("battery", battery, cache=True)
+        self._ready_events["battery"].set()
 
     def _on_gimbal_update(self, state: "GimbalState") -> None:
         """Handle gimbal update."""
+        # Only called when the orientation changed
         self.notify_attribute_listeners("gimbal", self._gimbal)
+        self._ready_events["gimbal"].set()
 
     # ===== Mode and Armed properties =====
 
@@ -308,13 +378,6 @@ class Vehicle(HasObservers):
         """Mission commands."""
         return self._commands
 
-    # ===== Message factory =====
-
-    @property
-    def message_factory(self) -> Any:
-        """MAVLink message factory."""
-        return self._master.mav
-
     # ===== Flight control methods =====
 
     def simple_takeoff(self, alt: float) -> None:
@@ -344,15 +407,6 @@ class Vehicle(HasObservers):
 
     # ===== MAVLink methods =====
 
-    def send_mavlink(self, message: Any) -> None:
-        """
-        Send a MAVLink message.
-
-        Args:
-            message: MAVLink message to send
-        """
-        self._master.mav.send(message)
-
     def flush(self) -> None:
         """Flush pending messages."""
         pass  # No-op in current implementation
@@ -445,35 +499,41 @@ class Vehicle(HasObservers):
         if not args:
             args = ("parameters", "gps_0", "armed", "mode", "attitude")
 
-        start = monotonic.monotonic()
+        start = _monotonic()
         for attr in args:
-            while True:
-                if timeout and (monotonic.monotonic() - start) > timeout:
-                    if raise_exception:
-                        raise TimeoutError(f"Timeout waiting for attribute: {attr}")
-                    return False
-
-                value = self._get_attribute_value(attr)
-                if value is not None:
-                    break
-                time.sleep(0.1)
+            ready = self._ready_events[attr]
+            while self._get_attribute_value(attr) is None:
+                wait = _READY_POLL_INTERVAL
+                if timeout:
+                    remaining = timeout - (_monotonic() - start)
+                    if remaining <= 0:
+                        if raise_exception:
+                            raise TimeoutError(
+                                f"Timeout waiting for attribute: {attr}"
+                            )
+                        return False
+                    wait = min(wait, remaining)
+                # Returns as soon as the attribute is signalled; attributes
+                # without a ready event are re-checked every interval
+                ready.wait(wait)
 
         return True
 
+    # Attributes whose readiness is read from the module directly
+    _ATTR_GETTERS: dict[str, Callable[["Vehicle"], Any]] = {
+        "parameters": lambda v: v._parameters.is_loaded or None,
+        "gps_0": lambda v: v._sensors.gps,
+        "armed": lambda v: v._flight_control.armed,
+        "mode": lambda v: v._flight_control.mode,
+        "attitude": lambda v: v._sensors.attitude,
+    }
+
     def _get_attribute_value(self, attr: str) -> Any:
         """Get the value of an attribute by name."""
-        if attr == "parameters":
-            return self._parameters.is_loaded or None
-        elif attr == "gps_0":
-            return self._sensors.gps
-        elif attr == "armed":
-            return self._flight_control.armed
-        elif attr == "mode":
-            return self._flight_control.mode
-        elif attr == "attitude":
-            return self._sensors.attitude
-        else:
-            return getattr(self, attr, None)
+        getter = self._ATTR_GETTERS.get(attr)
+        if getter is not None:
+            return getter(self)
+        return getattr(self, attr, None)
 
     # ===== Reboot =====
 
@@ -485,7 +545,10 @@ class Vehicle(HasObservers):
 
     def close(self) -> None:
         """Close the connection."""
+        # Stop the heartbeat watchdog so no disconnect is reported after close
+        self._heartbeat.detach()
         self._handler.close()
+        self._event_bus.close()
 
     @property
     def _vehicle(self) -> "Vehicle":
@@ -10,7 +10,12 @@ This module provides the foundational components used throughout dronesdk:
 
 from dronesdk.core.exceptions import APIException, TimeoutError
 from dronesdk.core.observer import HasObservers
-from dronesdk.core.events import EventBus, EventPriority, MAVLinkMessageEvent
+from dronesdk.core.events import (
+    EventBus,
+    EventPriority,
+    MAVLinkMessageEvent,
+    Subscription,
+)
 from dronesdk.core.types import (
     Observable,
     VehicleModule,
@@ -28,6 +33,7 @@ __all__ = [
     "EventBus",
     "EventPriority",
     "MAVLinkMessageEvent",
+    "Subscription",
     # Types
     "Observable",
     "VehicleModule",
@@ -8,14 +8,31 @@ other events without tight coupling.
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
+import operator
+import queue
 import threading
-from dataclasses import dataclass, field
+from collections import defaultdict
 from enum import IntEnum
-from typing import Any, Callable
+from time import monotonic as _monotonic
+from typing import Any, Callable, Mapping, NamedTuple, Sequence, Union
 
 logger = logging.getLogger(__name__)
 
+_PRIORITY_KEY = operator.attrgetter("priority")
+
+# A handler that keeps raising is logged at most once per interval (seconds)
+_ERROR_LOG_INTERVAL = 5.0
+# Most failing handlers whose error counts are kept at once
+_MAX_HANDLER_ERRORS = 256
+
+# Worker backlog (queued publishes) above which publishing warns, at most once per
+# _BACKLOG_LOG_INTERVAL seconds
+_BACKLOG_WARNING = 1000
+_BACKLOG_LOG_INTERVAL = 1.0
+
 
 class EventPriority(IntEnum):
     """Priority levels for event handlers."""
@@ -25,11 +42,13 @@ class EventPriority(IntEnum):
     LOW = 100  # Processed last (e.g., logging, telemetry)
 
 
-@dataclass(frozen=True)
-class MAVLinkMessageEvent:
+class MAVLinkMessageEvent(NamedTuple):
     """
     Event representing a received MAVLink message.
 
+    A NamedTuple rather than a dataclass: one is created for every
+    received message, and tuples are cheaper to build and read.
+
     Attributes:
         timestamp: Monotonic timestamp when the message was received
         message_type: The MAVLink message type name (e.g., 'HEARTBEAT')
@@ -41,8 +60,7 @@ class MAVLinkMessageEvent:
     message: Any
 
 
-@dataclass(frozen=True)
-class AttributeChangedEvent:
+class AttributeChangedEvent(NamedTuple):
     """
     Event representing an attribute change.
 
@@ -59,19 +77,126 @@ class AttributeChangedEvent:
     new_value: Any
 
 
-@dataclass
+class Subscription:
+    """
+    Handle returned by the EventBus subscribe methods.
+
+    Calling the handle removes the subscription; calling it again does
+    nothing.
+
+    Attributes:
+        id: The subscription ID, accepted by EventBus.unsubscribe()
+    """
+
+    __slots__ = ("_bus", "id")
+
+    def __init__(self, bus: EventBus, subscription_id: int) -> None:
+        self._bus = bus
+        self.id = subscription_id
+
+    def __call__(self) -> None:
+        """Remove the subscription."""
+        self._bus.unsubscribe(self.id)
+
+    def __repr__(self) -> str:
+        return f"Subscription(id={self.id})"
+
+
 class _Subscription:
     """Internal class representing a subscription."""
 
-    handler: Callable[[Any], None]
-    priority: EventPriority = EventPriority.NORMAL
+    __slots__ = ("handler", "priority")
+
+    def __init__(
+        self,
+        handler: Callable[[Any], None],
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> None:
+        self.handler = handler
+        self.priority = priority
+
+    def __lt__(self, other: _Subscription) -> bool:
+        # Ordering used by bisect.insort; equal priorities keep
+        # subscription order since insort inserts after equal items
+        return self.priority < other.priority
 
 
-@dataclass
 class _MessageSubscription(_Subscription):
     """Subscription for a specific message type."""
 
-    message_type: str = ""
+    __slots__ = ("message_type",)
+
+    def __init__(
+        self,
+        handler: Callable[[Any], None],
+        priority: EventPriority = EventPriority.NORMAL,
+        message_type: str = "",
+    ) -> None:
+        super().__init__(handler, priority)
+        self.message_type = message_type
+
+
+class _AttributeSubscription(_Subscription):
+    """Subscription for an attribute name (or '*')."""
+
+    __slots__ = ("attribute_name",)
+
+    def __init__(
+        self,
+        handler: Callable[[Any], None],
+        priority: EventPriority = EventPriority.NORMAL,
+        attribute_name: str = "",
+    ) -> None:
+        super().__init__(handler, priority)
+        self.attribute_name = attribute_name
+
+
+_Handlers = tuple[Callable[[Any], None], ...]
+
+
+class _MessageDispatch(NamedTuple):
+    """Handlers for one message type, split by where they run."""
+
+    inline: _Handlers  # HIGH priority, on the publisher
+    deferred: _Handlers  # Everything else, on the worker
+
+
+class _BusState(NamedTuple):
+    """
+    Immutable snapshot of the handlers used by the publish methods.
+
+    Each map holds, per type, the specific handlers merged with the
+    wildcard handlers and sorted by priority. Types without specific
+    handlers fall back to the wildcard entry. Only the bare handler
+    callables are kept; priority matters only when building the snapshot.
+    """
+
+    message_map: Mapping[str, _MessageDispatch]
+    wildcards: _MessageDispatch
+    attribute_map: Mapping[str, _Handlers]
+    attribute_wildcards: _Handlers
+    # Message types with specific handlers, and whether any wildcard
+    # message handler exists, for publishers filtering before publishing
+    subscribed_types: frozenset[str]
+    has_wildcard: bool
+
+
+_EMPTY_STATE = _BusState({}, _MessageDispatch((), ()), {}, (), frozenset(), False)
+
+# What the worker queue carries: one event or a batch of them
+_WorkItem = Union[MAVLinkMessageEvent, list[MAVLinkMessageEvent]]
+
+
+def _split_dispatch(handlers: list[_Subscription]) -> _MessageDispatch:
+    """Sort message handlers by priority and split off the inline ones."""
+    ordered = sorted(handlers, key=_PRIORITY_KEY)
+    split = 0
+    while split < len(ordered) and ordered[split].priority <= EventPriority.HIGH:
+        split += 1
+    return _MessageDispatch(
+        tuple(s.handler for s in ordered[:split]),
+        tuple(s.handler for s in ordered[split:]),
+    )
 
 
 class EventBus:
@@ -84,6 +209,10 @@ class EventBus:
     Features:
     - Priority-based handler execution
     - Thread-safe subscription management
+    - Lock-free publishing
+    - HIGH priority message handlers run on the publishing thread, all
+      others on a worker thread so slow handlers do not stall it; a
+      growing worker backlog is logged as a warning
     - Support for message type filtering
     - Wildcard subscriptions for all messages
 
@@ -100,24 +229,58 @@ class EventBus:
         "_message_handlers",
         "_wildcard_handlers",
         "_attribute_handlers",
+        "_subscriptions",
+        "_next_id",
+        "_state",
         "_lock",
+        "_worker",
+        "_worker_queue",
+        "_closed",
+        "_handler_errors",
+        "_backlog_logged_at",
     )
 
     def __init__(self) -> None:
-        self._lock = threading.RLock()
-        # Map from message_type to list of subscriptions
-        self._message_handlers: dict[str, list[_MessageSubscription]] = {}
+        # Guards the handler registries; only taken by (un)subscribe
+        self._lock = threading.Lock()
+        # Map from message_type to list of subscriptions. Lists left empty
+        # by unsubscribe are kept; building the snapshot skips them.
+        self._message_handlers: defaultdict[str, list[_Subscription]] = (
+            defaultdict(list)
+        )
         # Handlers for all messages (wildcard)
         self._wildcard_handlers: list[_Subscription] = []
         # Map from attribute_name to list of subscriptions
-        self._attribute_handlers: dict[str, list[_Subscription]] = {}
+        self._attribute_handlers: defaultdict[str, list[_Subscription]] = (
+            defaultdict(list)
+        )
+        # Every live subscription by ID, for unsubscribe()
+        self._subscriptions: dict[int, _Subscription] = {}
+        self._next_id = itertools.count(1)
+        # Snapshot read by the publish methods without locking. It is
+        # never mutated, only replaced as a whole under the lock.
+        self._state = _EMPTY_STATE
+        # Deferred (non-HIGH) message handlers are run by a daemon thread,
+        # started on first use
+        self._worker: threading.Thread | None = None
+        # Holds single events, lists from publish_message_batch, and None
+        # to stop the worker
+        self._worker_queue: queue.SimpleQueue[_WorkItem | None] = (
+            queue.SimpleQueue()
+        )
+        self._closed = False
+        # id(handler) -> [failures since last logged, time last logged,
+        # handler]. Keyed by id() since handlers need not be hashable;
+        # the handler is kept to detect a reused id.
+        self._handler_errors: dict[int, list[Any]] = {}
+        self._backlog_logged_at = float("-inf")
 
     def subscribe_message(
         self,
         message_type: str,
         handler: Callable[[MAVLinkMessageEvent], None],
         priority: EventPriority = EventPriority.NORMAL,
-    ) -> Callable[[], None]:
+    ) -> Subscription:
         """
         Subscribe to a specific MAVLink message type.
 
@@ -128,7 +291,7 @@ class EventBus:
             priority: Handler priority (lower values = higher priority)
 
         Returns:
-            Unsubscribe function - call it to remove the subscription
+            Subscription handle - call it to remove the subscription
         """
         subscription = _MessageSubscription(
             handler=handler,
@@ -137,30 +300,16 @@ class EventBus:
         )
 
         with self._lock:
-            if message_type not in self._message_handlers:
-                self._message_handlers[message_type] = []
-            handlers = self._message_handlers[message_type]
-            handlers.append(subscription)
-            # Sort by priority
-            handlers.sort(key=lambda s: s.priority)
-
-        def unsubscribe() -> None:
-            with self._lock:
-                if message_type in self._message_handlers:
-                    try:
-                        self._message_handlers[message_type].remove(subscription)
-                        if not self._message_handlers[message_type]:
-                            del self._message_handlers[message_type]
-                    except ValueError:
-                        pass  # Already removed
-
-        return unsubscribe
+            # Insert in priority order
+            bisect.insort(self._message_handlers[message_type], subscription)
+            self._update_message_state(message_type)
+            return self._register(subscription)
 
     def subscribe_all_messages(
         self,
         handler: Callable[[MAVLinkMessageEvent], None],
         priority: EventPriority = EventPriority.NORMAL,
-    ) -> Callable[[], None]:
+    ) -> Subscription:
         """
         Subscribe to all MAVLink messages.
 
@@ -169,29 +318,21 @@ class EventBus:
             priority: Handler priority (lower values = higher priority)
 
         Returns:
-            Unsubscribe function - call it to remove the subscription
+            Subscription handle - call it to remove the subscription
         """
         subscription = _Subscription(handler=handler, priority=priority)
 
         with self._lock:
-            self._wildcard_handlers.append(subscription)
-            self._wildcard_handlers.sort(key=lambda s: s.priority)
-
-        def unsubscribe() -> None:
-            with self._lock:
-                try:
-                    self._wildcard_handlers.remove(subscription)
-                except ValueError:
-                    pass
-
-        return unsubscribe
+            bisect.insort(self._wildcard_handlers, subscription)
+            self._update_message_state(None)
+            return self._register(subscription)
 
     def subscribe_attribute(
         self,
         attribute_name: str,
         handler: Callable[[AttributeChangedEvent], None],
         priority: EventPriority = EventPriority.NORMAL,
-    ) -> Callable[[], None]:
+    ) -> Subscription:
         """
         Subscribe to attribute change events.
 
@@ -201,28 +342,94 @@ class EventBus:
             priority: Handler priority
 
         Returns:
-            Unsubscribe function
+            Subscription handle - call it to remove the subscription
         """
-        subscription = _Subscription(handler=handler, priority=priority)
+        subscription = _AttributeSubscription(
+            handler=handler,
+            priority=priority,
+            attribute_name=attribute_name,
+        )
 
         with self._lock:
-            if attribute_name not in self._attribute_handlers:
-                self._attribute_handlers[attribute_name] = []
-            handlers = self._attribute_handlers[attribute_name]
-            handlers.append(subscription)
-            handlers.sort(key=lambda s: s.priority)
-
-        def unsubscribe() -> None:
-            with self._lock:
-                if attribute_name in self._attribute_handlers:
-                    try:
-                        self._attribute_handlers[attribute_name].remove(subscription)
-                        if not self._attribute_handlers[attribute_name]:
-                            del self._attribute_handlers[attribute_name]
-                    except ValueError:
-                        pass
-
-        return unsubscribe
+            bisect.insort(self._attribute_handlers[attribute_name], subscription)
+            self._update_attribute_state(attribute_name)
+            return self._register(subscription)
+
+    def unsubscribe(self, subscription_id: int) -> None:
+        """
+        Remove a subscription by ID.
+
+        Unknown or already removed IDs are ignored.
+
+        Args:
+            subscription_id: The ID of the subscription, available as
+                ``.id`` on the Subscription returned by the subscribe
+                methods
+        """
+        with self._lock:
+            subscription = self._subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return  # Already removed
+            # Don't keep a removed handler alive through its error count,
+            # unless another subscription still uses the same callable
+            handler = subscription.handler
+            if id(handler) in self._handler_errors and not any(
+                other.handler is handler for other in self._subscriptions.values()
+            ):
+                del self._handler_errors[id(handler)]
+
+            if isinstance(subscription, _MessageSubscription):
+                message_type = subscription.message_type
+                self._message_handlers[message_type].remove(subscription)
+                self._update_message_state(message_type)
+            elif isinstance(subscription, _AttributeSubscription):
+                attribute_name = subscription.attribute_name
+                self._attribute_handlers[attribute_name].remove(subscription)
+                self._update_attribute_state(attribute_name)
+            else:
+                self._wildcard_handlers.remove(subscription)
+                self._update_message_state(None)
+
+    def _register(self, subscription: _Subscription) -> Subscription:
+        """
+        Record a subscription under a new ID.
+
+        Must be called with the lock held. Returns the handle given to
+        subscribers, which refers to the subscription by ID rather than
+        holding it.
+        """
+        subscription_id = next(self._next_id)
+        self._subscriptions[subscription_id] = subscription
+        return Subscription(self, subscription_id)
+
+    def is_subscribed(self, message_type: str) -> bool:
+        """
+        Check whether publishing a message type would reach any handler.
+
+        Args:
+            message_type: The MAVLink message type name
+
+        Returns:
+            True if the type has handlers or any wildcard handler exists
+        """
+        state = self._state
+        return state.has_wildcard or message_type in state.subscribed_types
+
+    @property
+    def subscribed_types(self) -> frozenset[str]:
+        """
+        Message types that have specific handlers.
+
+        Rebuilt on every message (un)subscribe; read it once per batch of
+        messages rather than calling is_subscribed for each. Types outside
+        it still reach wildcard handlers, see has_wildcard.
+        """
+        return self._state.subscribed_types
+
+    @property
+    def has_wildcard(self) -> bool:
+        """Whether any handler is subscribed to all messages."""
+        return self._state.has_wildcard
 
     def publish_message(self, event: MAVLinkMessageEvent) -> None:
         """
@@ -231,25 +438,55 @@ class EventBus:
         Args:
             event: The MAVLinkMessageEvent to publish
         """
-        with self._lock:
-            # Get handlers for this specific message type
-            specific_handlers = list(self._message_handlers.get(event.message_type, []))
-            # Get wildcard handlers
-            wildcard_handlers = list(self._wildcard_handlers)
+        # A single attribute read; the snapshot is replaced, never mutated
+        state = self._state
+        dispatch = state.message_map.get(event.message_type, state.wildcards)
 
-        # Combine and sort by priority
-        all_handlers = specific_handlers + wildcard_handlers
-        all_handlers.sort(key=lambda s: s.priority)
+        if dispatch.inline:
+            self._call_handlers(dispatch.inline, event, "message", event.message_type)
 
-        # Invoke handlers outside the lock
-        for subscription in all_handlers:
-            try:
-                subscription.handler(event)
-            except Exception:
-                logger.exception(
-                    "Exception in message handler for %s",
-                    event.message_type,
+        if dispatch.deferred:
+            self._defer(event)
+
+    def publish_message_batch(self, events: Sequence[MAVLinkMessageEvent]) -> None:
+        """
+        Publish several MAVLink message events in order.
+
+        Equivalent to calling publish_message for each event, but the
+        subscription snapshot is read once and all deferred events are
+        handed to the worker in a single queue operation.
+
+        Args:
+            events: The events to publish
+        """
+        state = self._state
+        message_map = state.message_map
+        wildcards = state.wildcards
+        deferred: list[MAVLinkMessageEvent] = []
+
+        for event in events:
+            dispatch = message_map.get(event.message_type, wildcards)
+            if dispatch.inline:
+                self._call_handlers(
+                    dispatch.inline, event, "message", event.message_type
                 )
+            if dispatch.deferred:
+                deferred.append(event)
+
+        if deferred:
+            self._defer(deferred)
+
+    def _defer(self, item: _WorkItem) -> None:
+        """Queue an event or list of events for the worker thread."""
+        if self._worker is None:
+            self._start_worker()
+        if not self._closed:
+            # The worker looks the handlers up again, so only the events
+            # themselves are queued
+            worker_queue = self._worker_queue
+            worker_queue.put(item)
+            if worker_queue.qsize() > _BACKLOG_WARNING:
+                self._warn_backlog(worker_queue.qsize())
 
     def publish_attribute_change(self, event: AttributeChangedEvent) -> None:
         """
@@ -258,23 +495,137 @@ class EventBus:
         Args:
             event: The AttributeChangedEvent to publish
         """
+        state = self._state
+        all_handlers = state.attribute_map.get(
+            event.attribute_name, state.attribute_wildcards
+        )
+
+        if all_handlers:
+            self._call_handlers(all_handlers, event, "attribute", event.attribute_name)
+
+    def close(self, timeout: float | None = 1.0) -> None:
+        """
+        Stop the worker thread.
+
+        Events already queued are still delivered; deferred handlers of
+        messages published afterwards are not called.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is None:
+            return
+        self._worker_queue.put(None)
+        if worker is not threading.current_thread():
+            worker.join(timeout)
+
+    def _start_worker(self) -> None:
+        """Start the worker thread if it is not running yet."""
         with self._lock:
-            specific_handlers = list(
-                self._attribute_handlers.get(event.attribute_name, [])
+            if self._worker is not None or self._closed:
+                return
+            worker = threading.Thread(
+                target=self._drain_worker,
+                name="EventBusWorker",
+                daemon=True,
             )
-            wildcard_handlers = list(self._attribute_handlers.get("*", []))
+            self._worker = worker
+        worker.start()
+
+    def _drain_worker(self) -> None:
+        """Run deferred message handlers until close() is called."""
+        get = self._worker_queue.get
+        while True:
+            item = get()
+            if item is None:
+                break
+            for event in item if isinstance(item, list) else (item,):
+                # Resolved from the current snapshot, so handlers removed
+                # since the event was queued are not called
+                state = self._state
+                handlers = state.message_map.get(event.message_type, state.wildcards)
+                self._call_handlers(
+                    handlers.deferred, event, "message", event.message_type
+                )
+
+    def _warn_backlog(self, backlog: int) -> None:
+        """Warn that deferred handlers are falling behind, rate limited."""
+        now = _monotonic()
+        if now - self._backlog_logged_at < _BACKLOG_LOG_INTERVAL:
+            return
+        self._backlog_logged_at = now
+        logger.warning(
+            "EventBus worker is %d publishes behind; deferred handlers are "
+            "slower than the incoming message rate",
+            backlog,
+        )
 
-        all_handlers = specific_handlers + wildcard_handlers
-        all_handlers.sort(key=lambda s: s.priority)
+    def _call_handlers(
+        self,
+        handlers: _Handlers,
+        event: Any,
+        kind: str,
+        name: str,
+    ) -> None:
+        """
+        Call every handler with the event, logging any exception raised.
 
-        for subscription in all_handlers:
+        A single try block covers the loop rather than one per handler.
+        After a failure the loop resumes with the next handler, so one bad
+        handler does not stop the others.
+        """
+        remaining = iter(handlers)
+        while True:
             try:
-                subscription.handler(event)
+                for handler in remaining:
+                    handler(event)
+                return
             except Exception:
-                logger.exception(
-                    "Exception in attribute handler for %s",
-                    event.attribute_name,
-                )
+                self._log_handler_error(handler, kind, name)
+
+    def _log_handler_error(
+        self,
+        handler: Callable[[Any], None],
+        kind: str,
+        name: str,
+    ) -> None:
+        """
+        Log the exception being handled, rate limited per handler.
+
+        A handler failing on every message is logged once per
+        _ERROR_LOG_INTERVAL along with the number of failures in between,
+        rather than formatting a traceback each time.
+        """
+        now = _monotonic()
+        # The publisher and the worker thread both get here, and
+        # unsubscribe() prunes the counts, so they change under the lock
+        with self._lock:
+            handler_errors = self._handler_errors
+            errors = handler_errors.get(id(handler))
+            if errors is None or errors[2] is not handler:
+                if len(handler_errors) >= _MAX_HANDLER_ERRORS:
+                    # Forget the oldest entry; dicts keep insertion order
+                    handler_errors.pop(next(iter(handler_errors)), None)
+                errors = [0, now - _ERROR_LOG_INTERVAL, handler]
+                handler_errors[id(handler)] = errors
+            errors[0] += 1
+            if now - errors[1] < _ERROR_LOG_INTERVAL:
+                return
+            failures = errors[0]
+            errors[0] = 0
+            errors[1] = now
+        logger.exception(
+            "Exception in %s handler %r for %s (%d failures since last report)",
+            kind,
+            handler,
+            name,
+            failures,
+        )
 
     def clear(self) -> None:
         """Remove all subscriptions."""
@@ -282,3 +633,67 @@ class EventBus:
             self._message_handlers.clear()
             self._wildcard_handlers.clear()
             self._attribute_handlers.clear()
+            self._subscriptions.clear()
+            self._handler_errors.clear()
+            self._state = _EMPTY_STATE
+
+    def _update_message_state(self, message_type: str | None) -> None:
+        """
+        Publish a new snapshot after a message subscription change.
+
+        Must be called with the lock held. ``None`` means the wildcard
+        handlers changed, which affects every message type.
+        """
+        state = self._state
+        wildcards = _split_dispatch(self._wildcard_handlers)
+        if message_type is None:
+            message_types = self._message_handlers.keys()
+            message_map = {}
+        else:
+            message_types = (message_type,)
+            message_map = dict(state.message_map)
+            message_map.pop(message_type, None)
+
+        for name in message_types:
+            handlers = self._message_handlers.get(name)
+            if handlers:
+                message_map[name] = _split_dispatch(
+                    handlers + self._wildcard_handlers
+                )
+
+        self._state = state._replace(
+            message_map=message_map,
+            wildcards=wildcards,
+            subscribed_types=frozenset(message_map),
+            has_wildcard=bool(self._wildcard_handlers),
+        )
+
+    def _update_attribute_state(self, attribute_name: str) -> None:
+        """
+        Publish a new snapshot after an attribute subscription change.
+
+        Must be called with the lock held.
+        """
+        state = self._state
+        wildcard_handlers = self._attribute_handlers.get("*", [])
+        if attribute_name == "*":
+            # Wildcard handlers are merged into every attribute's tuple
+            attribute_names = self._attribute_handlers.keys()
+            attribute_map = {}
+        else:
+            attribute_names = (attribute_name,)
+            attribute_map = dict(state.attribute_map)
+            attribute_map.pop(attribute_name, None)
+
+        for name in attribute_names:
+            handlers = self._attribute_handlers.get(name)
+            if handlers and name != "*":
+                attribute_map[name] = tuple(
+                    s.handler
+                    for s in sorted(handlers + wildcard_handlers, key=_PRIORITY_KEY)
+                )
+
+        self._state = state._replace(
+            attribute_map=attribute_map,
+            attribute_wildcards=tuple(s.handler for s in wildcard_handlers),
+        )
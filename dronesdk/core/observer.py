@@ -8,11 +8,17 @@ change notifications throughout dronesdk.
 from __future__ import annotations
 
 import logging
+from itertools import chain
 from typing import Any, Callable
 
+logger = logging.getLogger(__name__)
+
 # Type alias for observer callbacks
 ObserverCallback = Callable[["HasObservers", str, Any], None]
 
+# Marks an attribute that has no cached value yet
+_MISSING = object()
+
 
 class HasObservers:
     """
@@ -35,13 +41,20 @@ class HasObservers:
         ...     print(f"Mode changed to {value}")
     """
 
-    __slots__ = ("_logger", "_attribute_listeners", "_attribute_cache")
+    __slots__ = (
+        "_attribute_listeners",
+        "_wildcard_listeners",
+        "_attribute_cache",
+    )
 
     def __init__(self) -> None:
-        logging.basicConfig()
-        self._logger = logging.getLogger(__name__)
-        # A mapping from attr_name to a list of observers
-        self._attribute_listeners: dict[str, list[ObserverCallback]] = {}
+        # A mapping from attr_name to the observers, held as the keys of an
+        # insertion-ordered dict for O(1) membership tests. The inner dicts
+        # are replaced rather than mutated, so notify can iterate them
+        # safely while a callback adds or removes listeners.
+        self._attribute_listeners: dict[str, dict[ObserverCallback, None]] = {}
+        # Same dict as _attribute_listeners["*"], kept for notify
+        self._wildcard_listeners: dict[ObserverCallback, None] = {}
         self._attribute_cache: dict[str, Any] = {}
 
     def add_attribute_listener(
@@ -56,7 +69,7 @@ class HasObservers:
         Attributes that represent sensor values or which are used to monitor connection
         status are updated whenever a message is received from the vehicle. Attributes
         which reflect vehicle "state" are only updated when their values change
-        (e.g., system_status, armed, mode).
+        (e.g., system_status, armed, mode), as are attitude, battery and gimbal.
 
         The callback can be removed using :py:func:`remove_attribute_listener`.
 
@@ -70,12 +83,11 @@ class HasObservers:
             but with more elegant syntax. Use ``add_attribute_listener`` if
             you need to remove the observer later.
         """
-        listeners_for_attr = self._attribute_listeners.get(attr_name)
-        if listeners_for_attr is None:
-            listeners_for_attr = []
-            self._attribute_listeners[attr_name] = listeners_for_attr
+        listeners_for_attr = self._attribute_listeners.get(attr_name, {})
         if observer not in listeners_for_attr:
-            listeners_for_attr.append(observer)
+            listeners = dict(listeners_for_attr)
+            listeners[observer] = None
+            self._set_listeners(attr_name, listeners)
 
     def remove_attribute_listener(
         self,
@@ -85,16 +97,31 @@ class HasObservers:
         """
         Remove an attribute listener that was previously added.
 
+        Removing an observer that is not registered does nothing.
+
         Args:
             attr_name: The attribute name to remove the observer from
                       (or '*' to remove an 'all attribute' observer).
             observer: The callback function to remove.
         """
         listeners_for_attr = self._attribute_listeners.get(attr_name)
-        if listeners_for_attr is not None:
-            listeners_for_attr.remove(observer)
-            if len(listeners_for_attr) == 0:
-                del self._attribute_listeners[attr_name]
+        if listeners_for_attr is not None and observer in listeners_for_attr:
+            listeners = dict(listeners_for_attr)
+            del listeners[observer]
+            self._set_listeners(attr_name, listeners)
+
+    def _set_listeners(
+        self,
+        attr_name: str,
+        listeners: dict[ObserverCallback, None],
+    ) -> None:
+        """Replace the listeners for an attribute."""
+        if listeners:
+            self._attribute_listeners[attr_name] = listeners
+        else:
+            del self._attribute_listeners[attr_name]
+        if attr_name == "*":
+            self._wildcard_listeners = listeners
 
     def notify_attribute_listeners(
         self,
@@ -116,32 +143,35 @@ class HasObservers:
                   Use True for state attributes like 'mode'.
                   Use False for sensor/heartbeat monitoring.
         """
-        # Cached values are not re-sent if they are unchanged.
+        # Cached values are not re-sent if they are unchanged. The cache is
+        # kept up to date even with no listeners, for those added later.
         if cache:
-            if self._attribute_cache.get(attr_name) == value:
+            attribute_cache = self._attribute_cache
+            previous = attribute_cache.get(attr_name, _MISSING)
+            # Identity first: cheap for repeated enums, bools and objects
+            # the publisher reuses, and skips a field-by-field __eq__
+            if previous is value or previous == value:
                 return
-            self._attribute_cache[attr_name] = value
+            attribute_cache[attr_name] = value
 
-        # Notify specific attribute observers
-        for fn in self._attribute_listeners.get(attr_name, []):
-            try:
-                fn(self, attr_name, value)
-            except Exception:
-                self._logger.exception(
-                    "Exception in attribute handler for %s",
-                    attr_name,
-                    exc_info=True,
-                )
+        # Nothing to do while nobody is listening
+        if not self._attribute_listeners:
+            return
 
-        # Notify wildcard observers
-        for fn in self._attribute_listeners.get("*", []):
+        # Specific attribute observers first, then wildcard observers
+        for fn in chain(
+            self._attribute_listeners.get(attr_name, ()),
+            self._wildcard_listeners,
+        ):
             try:
                 fn(self, attr_name, value)
-            except Exception:
-                self._logger.exception(
-                    "Exception in attribute handler for %s",
+            except Exception as exc:
+                # Formatting the traceback is costly; only do it when debugging
+                logger.error(
+                    "Exception in attribute handler for %s: %r",
                     attr_name,
-                    exc_info=True,
+                    exc,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
                 )
 
     def on_attribute(self, name: str | list[str]) -> Callable[[ObserverCallback], None]:
@@ -5,12 +5,18 @@ This module provides the MAVLink connection and message routing infrastructure.
 """
 
 from dronesdk.datalink.connection import MAVConnection, MAVWriter
-from dronesdk.datalink.heartbeat import HeartbeatManager
+from dronesdk.datalink.heartbeat import (
+    HeartbeatManager,
+    VehicleHeartbeatEvent,
+    VehicleHeartbeatFilter,
+)
 from dronesdk.datalink.message_router import MessageRouter
 
 __all__ = [
     "MAVConnection",
     "MAVWriter",
     "HeartbeatManager",
+    "VehicleHeartbeatEvent",
+    "VehicleHeartbeatFilter",
     "MessageRouter",
 ]
@@ -13,10 +13,10 @@ import errno
 import logging
 import os
 import platform
+import selectors
 import socket
-import time
-from queue import Empty, Queue
-from threading import Thread
+from collections import deque
+from threading import Condition, Event, Lock, Thread, get_ident
 from typing import Any, Callable
 
 from pymavlink import mavutil
@@ -30,6 +30,103 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# How long the output thread waits for packets before re-checking that
+# the connection is still alive
+_WRITER_IDLE_TIMEOUT = 0.1
+
+# How long close() waits for queued packets to be written
+_CLOSE_DRAIN_TIMEOUT = 5.0
+
+# recv() errors that only mean "nothing to read right now"
+_UDP_TRANSIENT_ERRNOS = frozenset(
+    (errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNREFUSED, errno.ECONNRESET)
+)
+
+# Largest UDP payload; size of the reusable receive buffer
+_UDP_MAX_PACKET = 65535
+
+# Input loop period while loop listeners are registered, and the poll
+# interval for links without a selectable file descriptor
+_LOOP_INTERVAL = 0.05
+
+# Most messages handed to batch listeners at once; a link that never goes
+# idle is still delivered in bounded chunks
+_MAX_BATCH = 64
+
+# How long stop_threads() waits for each input/output thread to finish
+_STOP_TIMEOUT = 2.0
+
+
+class _PacketQueue:
+    """
+    Buffer of outgoing packets.
+
+    Writers append single packets; the output thread takes everything
+    queued so far in one call, so a burst of packets costs one wakeup and
+    one lock round-trip instead of one per packet. Both conditions share
+    one lock, so queueing a packet is a single acquire plus a notify.
+    Supports the subset of the ``queue.Queue`` interface used by MAVWriter
+    and pipe().
+    """
+
+    __slots__ = ("_packets", "_lock", "_not_empty", "_all_written", "_writing")
+
+    def __init__(self) -> None:
+        self._packets: deque[bytes] = deque()
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._all_written = Condition(self._lock)
+        # True while the output thread holds a batch it has not written
+        self._writing = False
+
+    def put(self, pkt: bytes) -> None:
+        """Queue a packet and wake the output thread."""
+        with self._lock:
+            self._packets.append(pkt)
+            self._not_empty.notify()
+
+    def get_all(self, timeout: float | None = None) -> deque[bytes]:
+        """
+        Take every queued packet, waiting up to `timeout` for the first.
+
+        Returns:
+            The queued packets in order (empty on timeout)
+        """
+        with self._lock:
+            if not self._packets:
+                self._not_empty.wait(timeout)
+            packets = self._packets
+            if packets:
+                self._packets = deque()
+                self._writing = True
+        return packets
+
+    def empty(self) -> bool:
+        """Check whether no packets are queued."""
+        return not self._packets
+
+    def mark_written(self) -> None:
+        """Signal that the last batch was written; wakes join() if idle."""
+        with self._lock:
+            self._writing = False
+            if not self._packets:
+                self._all_written.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        Block until every queued packet has been written.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = forever)
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._lock:
+            return self._all_written.wait_for(
+                lambda: not self._packets and not self._writing, timeout
+            )
+
 
 class MAVWriter:
     """
@@ -41,7 +138,7 @@ class MAVWriter:
 
     __slots__ = ("_logger", "queue")
 
-    def __init__(self, queue: Queue[bytes]) -> None:
+    def __init__(self, queue: _PacketQueue) -> None:
         self._logger = logging.getLogger(__name__)
         self.queue = queue
 
@@ -83,7 +180,14 @@ class MAVUDPMulti(mavutil.mavfile):
         self.udp_server = input
         self.broadcast = False
         self.addresses: set[tuple[str, int]] = set()
+        # Snapshot of addresses for write(), rebuilt only when one is added
+        self._address_tuple: tuple[tuple[str, int], ...] = ()
         self.destination_addr: tuple[str, int] | None = None
+        # Set once the socket is connected to destination_addr
+        self._connected = False
+        # Reused for every datagram so recv() allocates only the payload
+        self._recv_buf = bytearray(_UDP_MAX_PACKET)
+        self._recv_view = memoryview(self._recv_buf)
 
         if input:
             self.port.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -111,36 +215,50 @@ class MAVUDPMulti(mavutil.mavfile):
         self.port.close()
 
     def recv(self, n: int | None = None) -> bytes:
-        """Receive data from the UDP socket."""
+        """
+        Receive data from the UDP socket.
+
+        Besides "no data", refused/reset errors are ignored: on UDP they only
+        report an ICMP unreachable for an earlier send. Any other socket
+        error propagates to the input loop.
+        """
         try:
-            try:
-                data, new_addr = self.port.recvfrom(65535)
-            except socket.error as e:
-                if e.errno in [errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNREFUSED]:
-                    return b""
-                raise
-            if self.udp_server:
+            nbytes, new_addr = self.port.recvfrom_into(self._recv_buf)
+        except socket.error as e:
+            if e.errno in _UDP_TRANSIENT_ERRNOS:
+                return b""
+            raise
+        if self.udp_server:
+            if new_addr not in self.addresses:
                 self.addresses.add(new_addr)
-            elif self.broadcast:
-                self.addresses = {new_addr}
-            return data
-        except Exception:
-            self._logger.exception("Exception while reading data", exc_info=True)
-            return b""
+                self._address_tuple = tuple(self.addresses)
+        elif self.broadcast:
+            self.addresses = {new_addr}
+            self._address_tuple = (new_addr,)
+        return bytes(self._recv_view[:nbytes])
 
     def write(self, buf: bytes) -> None:
         """Write data to the UDP socket."""
         try:
             try:
                 if self.udp_server:
-                    for addr in self.addresses:
-                        self.port.sendto(buf, addr)
+                    sendto = self.port.sendto
+                    for addr in self._address_tuple:
+                        try:
+                            sendto(buf, addr)
+                        except socket.error:
+                            # An unreachable endpoint must not cost the
+                            # remaining ones this packet
+                            pass
                 else:
-                    if self.addresses and self.broadcast:
-                        self.destination_addr = list(self.addresses)[0]
+                    if self._address_tuple and self.broadcast:
+                        self.destination_addr = self._address_tuple[0]
                         self.broadcast = False
                         self.port.connect(self.destination_addr)
-                    if self.destination_addr:
+                        self._connected = True
+                    if self._connected:
+                        self.port.send(buf)
+                    elif self.destination_addr:
                         self.port.sendto(buf, self.destination_addr)
             except socket.error:
                 pass
@@ -164,9 +282,152 @@ class MAVUDPMulti(mavutil.mavfile):
 
 # Type alias for message callback
 MessageCallback = Callable[["MAVConnection", Any], None]
+BatchCallback = Callable[["MAVConnection", "list[Any]"], None]
 LoopCallback = Callable[["MAVConnection"], None]
 
 
+class _InputReactor:
+    """
+    Input thread shared by every open connection.
+
+    Waits on the file descriptors of all registered connections with one
+    selector and reads whichever are ready, so a fleet of vehicles costs
+    one input thread rather than one per connection. Message and loop
+    listeners of every connection run on this thread and must not block.
+
+    Registration changes are queued and applied by the reactor thread
+    itself, so the selector is only ever touched from that thread.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_selector",
+        "_connections",
+        "_pending",
+        "_wakeup_recv",
+        "_wakeup_send",
+        "_thread",
+    )
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._selector = selectors.DefaultSelector()
+        # Registered connection -> the fd it was registered with
+        self._connections: dict[MAVConnection, int] = {}
+        self._pending: list[tuple[MAVConnection, bool, Event]] = []
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        self._thread: Thread | None = None
+
+    def add(self, connection: MAVConnection) -> Event:
+        """Start reading from a connection."""
+        return self._request(connection, True)
+
+    def remove(self, connection: MAVConnection) -> Event:
+        """
+        Stop reading from a connection.
+
+        Returns:
+            Event set once the reactor no longer reads the connection
+        """
+        return self._request(connection, False)
+
+    def in_reactor_thread(self) -> bool:
+        """Check whether the caller is running on the reactor thread."""
+        return self._thread is not None and self._thread.ident == get_ident()
+
+    def _request(self, connection: MAVConnection, add: bool) -> Event:
+        """Queue a registration change and wake the reactor."""
+        done = Event()
+        with self._lock:
+            self._pending.append((connection, add, done))
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="MAVLinkReactor", daemon=True
+                )
+                self._thread.start()
+        try:
+            self._wakeup_send.send(b"\0")
+        except OSError:
+            # Buffer full: a wakeup is already pending
+            pass
+        return done
+
+    def _apply_pending(self) -> None:
+        """Apply queued registration changes; reactor thread only."""
+        try:
+            while self._wakeup_recv.recv(4096):
+                pass
+        except OSError:
+            pass
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for connection, add, done in pending:
+            try:
+                self._discard(connection)
+                fd = getattr(connection.master, "fd", None)
+                if add and connection.is_alive and fd is not None:
+                    self._selector.register(fd, selectors.EVENT_READ, connection)
+                    self._connections[connection] = fd
+            except Exception as e:
+                # A closed fd, or one epoll refuses (e.g. a regular file),
+                # must not take down the other connections' input
+                connection._read_in_own_thread(e)
+            finally:
+                done.set()
+
+    def _discard(self, connection: MAVConnection) -> None:
+        """Unregister a connection if it is registered."""
+        fd = self._connections.pop(connection, None)
+        if fd is not None:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, OSError, ValueError):
+                pass
+
+    def _run(self) -> None:
+        """Reactor loop."""
+        connections = self._connections
+        while True:
+            # Loop listeners need a periodic tick; otherwise block until
+            # data arrives or a registration change wakes us
+            ticking = False
+            for connection in tuple(connections):
+                try:
+                    if connection._run_loop_listeners():
+                        ticking = True
+                except Exception as e:
+                    connection._input_failed(e)
+                    self._discard(connection)
+
+            timeout = _LOOP_INTERVAL if ticking else None
+            for key, _ in self._selector.select(timeout):
+                connection = key.data
+                if connection is None:
+                    self._apply_pending()
+                elif connection in connections:
+                    try:
+                        connection._read_messages()
+                    except Exception as e:
+                        connection._input_failed(e)
+                        self._discard(connection)
+
+
+_reactor: _InputReactor | None = None
+_reactor_lock = Lock()
+
+
+def _get_reactor() -> _InputReactor:
+    """Get the shared input reactor, creating it on first use."""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = _InputReactor()
+        return _reactor
+
+
 class MAVConnection:
     """
     MAVLink connection manager.
@@ -177,6 +438,11 @@ class MAVConnection:
     - Thread management for I/O
     - Message listener registration
 
+    Connections with a selectable file descriptor are read by a reactor
+    thread shared with every other connection; others (e.g. serial ports
+    on Windows) get an input thread of their own. Each connection keeps
+    its own output thread.
+
     Args:
         ip: Connection string (e.g., "udpin:localhost:14550", "tcp:127.0.0.1:5760")
         baud: Baud rate for serial connections
@@ -193,13 +459,25 @@ class MAVConnection:
         "target_system",
         "loop_listeners",
         "message_listeners",
+        "_listeners_by_type",
+        "_listeners_version",
+        "_snapshot_version",
+        "_loop_snapshot",
+        "_message_snapshot",
+        "_typed_snapshot",
+        "_batch_listeners",
+        "_batch_snapshot",
         "_accept_input",
         "_alive",
         "_death_error",
+        "_reactor",
         "mavlink_thread_in",
         "mavlink_thread_out",
     )
 
+    # Whether each message class carries a target_system field
+    _HAS_TARGET_SYSTEM: dict[type, bool] = {}
+
     def __init__(
         self,
         ip: str,
@@ -229,7 +507,7 @@ class MAVConnection:
             )
 
         # Message output queue
-        self.out_queue: Queue[bytes] = Queue()
+        self.out_queue = _PacketQueue()
         self.master.mav = mavutil.mavlink.MAVLink(
             MAVWriter(self.out_queue),
             srcSystem=self.master.source_system,
@@ -252,13 +530,25 @@ class MAVConnection:
         # Listeners
         self.loop_listeners: list[LoopCallback] = []
         self.message_listeners: list[MessageCallback] = []
+        self._listeners_by_type: dict[str, list[MessageCallback]] = {}
+        # Bumped on registration so the input thread knows to re-snapshot
+        self._listeners_version = 0
+        self._snapshot_version = -1
+        self._loop_snapshot: tuple[LoopCallback, ...] = ()
+        self._message_snapshot: tuple[MessageCallback, ...] = ()
+        # Type-specific listeners followed by the catch-all ones
+        self._typed_snapshot: dict[str, tuple[MessageCallback, ...]] = {}
+        self._batch_listeners: list[BatchCallback] = []
+        self._batch_snapshot: tuple[BatchCallback, ...] = ()
 
         # State flags
         self._accept_input = True
         self._alive = True
         self._death_error: Exception | None = None
 
-        # Thread handles
+        # Thread handles; _reactor is set while the shared reactor reads
+        # this connection in place of mavlink_thread_in
+        self._reactor: _InputReactor | None = None
         self.mavlink_thread_in: Thread | None = None
         self.mavlink_thread_out: Thread | None = None
 
@@ -275,9 +565,11 @@ class MAVConnection:
 
     def _create_threads(self) -> None:
         """Create the I/O threads."""
-        t = Thread(target=self._mavlink_thread_in)
-        t.daemon = True
-        self.mavlink_thread_in = t
+        # Links without a selectable fd cannot join the reactor
+        if getattr(self.master, "fd", None) is None:
+            t = Thread(target=self._mavlink_thread_in)
+            t.daemon = True
+            self.mavlink_thread_in = t
 
         t = Thread(target=self._mavlink_thread_out)
         t.daemon = True
@@ -288,10 +580,15 @@ class MAVConnection:
         try:
             while self._alive:
                 try:
-                    msg = self.out_queue.get(True, timeout=0.01)
-                    self.master.write(msg)
-                except Empty:
-                    continue
+                    # Send everything queued since the last wakeup
+                    out_queue = self.out_queue
+                    packets = out_queue.get_all(_WRITER_IDLE_TIMEOUT)
+                    try:
+                        for msg in packets:
+                            self.master.write(msg)
+                    finally:
+                        # A failed write must not leave join() waiting
+                        out_queue.mark_written()
                 except socket.error as error:
                     if error.errno == ECONNABORTED:
                         raise APIException("Connection aborting during write")
@@ -309,75 +606,170 @@ class MAVConnection:
                 self._alive = False
                 self.master.close()
                 self._death_error = e
+        if self._reactor is not None:
+            self._reactor.remove(self)
 
         # Clear output queue
-        self.out_queue = Queue()
+        self.out_queue = _PacketQueue()
 
     def _mavlink_thread_in(self) -> None:
-        """Input thread - receives and dispatches messages."""
+        """Input thread for links the reactor cannot wait on."""
         try:
             while self._alive:
-                # Loop listeners
-                for fn in self.loop_listeners:
-                    fn(self)
+                self._run_loop_listeners()
+                self.master.select(_LOOP_INTERVAL)
+                self._read_messages()
+        except Exception as e:
+            self._input_failed(e)
+
+    def _refresh_listeners(self) -> None:
+        """Re-snapshot the listener lists after a registration."""
+        self._snapshot_version = self._listeners_version
+        self._loop_snapshot = tuple(self.loop_listeners)
+        message_listeners = tuple(self.message_listeners)
+        self._message_snapshot = message_listeners
+        self._typed_snapshot = {
+            msg_type: tuple(fns) + message_listeners
+            for msg_type, fns in self._listeners_by_type.items()
+        }
+        self._batch_snapshot = tuple(self._batch_listeners)
+
+    def _run_loop_listeners(self) -> bool:
+        """
+        Call the loop listeners.
 
-                # Sleep/select
-                self.master.select(0.05)
+        Returns:
+            True if any loop listeners are registered
+        """
+        if self._listeners_version != self._snapshot_version:
+            self._refresh_listeners()
+        loop_listeners = self._loop_snapshot
+        for fn in loop_listeners:
+            fn(self)
+        return bool(loop_listeners)
+
+    def _read_messages(self) -> None:
+        """Receive and dispatch every message that is ready."""
+        if self._listeners_version != self._snapshot_version:
+            self._refresh_listeners()
+        message_listeners = self._message_snapshot
+        typed_listeners = self._typed_snapshot
+        batch_listeners = self._batch_snapshot
+        batch: list[Any] | None = [] if batch_listeners else None
 
-                while self._accept_input:
-                    try:
-                        msg = self.master.recv_msg()
-                    except socket.error as error:
-                        if error.errno == ECONNABORTED:
-                            raise APIException("Connection aborting during read")
-                        raise
-                    except mavutil.mavlink.MAVError as e:
-                        self._logger.debug("mav recv error: %s", e)
-                        msg = None
-                    except Exception:
+        try:
+            self._receive(message_listeners, typed_listeners, batch)
+        finally:
+            if batch:
+                self._dispatch_batch(batch_listeners, batch)
+
+    def _receive(
+        self,
+        message_listeners: tuple[MessageCallback, ...],
+        typed_listeners: dict[str, tuple[MessageCallback, ...]],
+        batch: list[Any] | None,
+    ) -> None:
+        """Read messages until none are ready, collecting them in `batch`."""
+        while self._accept_input:
+            try:
+                msg = self.master.recv_msg()
+            except socket.error as error:
+                if error.errno == ECONNABORTED:
+                    raise APIException("Connection aborting during read")
+                raise
+            except mavutil.mavlink.MAVError as e:
+                self._logger.debug("mav recv error: %s", e)
+                msg = None
+            except Exception:
+                self._logger.exception(
+                    "Exception while receiving message: ",
+                    exc_info=True,
+                )
+                msg = None
+
+            if not msg:
+                break
+
+            # Dispatch to message listeners
+            listeners = message_listeners
+            msg_type = None
+            if typed_listeners:
+                msg_type = msg.get_type()
+                listeners = typed_listeners.get(msg_type, message_listeners)
+            for fn in listeners:
+                try:
+                    fn(self, msg)
+                except Exception:
+                    if self._logger.isEnabledFor(logging.ERROR):
+                        if msg_type is None:
+                            msg_type = msg.get_type()
                         self._logger.exception(
-                            "Exception while receiving message: ",
+                            "Exception in message handler for %s",
+                            msg_type,
                             exc_info=True,
                         )
-                        msg = None
 
-                    if not msg:
-                        break
+            if batch is not None:
+                batch.append(msg)
+                if len(batch) >= _MAX_BATCH:
+                    self._dispatch_batch(self._batch_snapshot, batch)
+                    batch.clear()
 
-                    # Dispatch to message listeners
-                    for fn in self.message_listeners:
-                        try:
-                            fn(self, msg)
-                        except Exception:
-                            self._logger.exception(
-                                "Exception in message handler for %s",
-                                msg.get_type(),
-                                exc_info=True,
-                            )
+    def _dispatch_batch(
+        self,
+        batch_listeners: tuple[BatchCallback, ...],
+        batch: list[Any],
+    ) -> None:
+        """Hand a burst of messages to the batch listeners."""
+        for fn in batch_listeners:
+            try:
+                fn(self, batch)
+            except Exception:
+                self._logger.exception(
+                    "Exception in message batch handler", exc_info=True
+                )
 
-        except APIException as e:
+    def _input_failed(self, error: Exception) -> None:
+        """Mark the connection dead after an input error; call from except."""
+        if isinstance(error, APIException):
             self._logger.exception("Exception in MAVLink input loop")
             self._alive = False
             self.master.close()
-            self._death_error = e
-        except Exception as e:
-            if self._alive:
-                self._alive = False
-                self.master.close()
-                self._death_error = e
+            self._death_error = error
+        elif self._alive:
+            self._alive = False
+            self.master.close()
+            self._death_error = error
+
+    def _read_in_own_thread(self, error: Exception) -> None:
+        """Fall back to mavlink_thread_in when the reactor cannot take the fd."""
+        self._logger.debug("Reactor cannot read connection: %s", error)
+        self._reactor = None
+        if self.mavlink_thread_in is None and self._alive:
+            t = Thread(target=self._mavlink_thread_in)
+            t.daemon = True
+            self.mavlink_thread_in = t
+            t.start()
 
     def stop_threads(self) -> None:
         """Stop the I/O threads."""
+        reactor = self._reactor
+        if reactor is not None:
+            self._reactor = None
+            removed = reactor.remove(self)
+            # A listener closing its own connection runs on the reactor
+            if not reactor.in_reactor_thread():
+                removed.wait(_STOP_TIMEOUT)
         if self.mavlink_thread_in is not None:
-            self.mavlink_thread_in.join(timeout=2.0)
+            self.mavlink_thread_in.join(timeout=_STOP_TIMEOUT)
             self.mavlink_thread_in = None
         if self.mavlink_thread_out is not None:
-            self.mavlink_thread_out.join(timeout=2.0)
+            self.mavlink_thread_out.join(timeout=_STOP_TIMEOUT)
             self.mavlink_thread_out = None
 
     def reset(self) -> None:
         """Reset the connection."""
-        self.out_queue = Queue()
+        self.out_queue = _PacketQueue()
         if hasattr(self.master, "reset"):
             self.master.reset()
         else:
@@ -386,10 +778,18 @@ class MAVConnection:
             except Exception:
                 pass
             self.master = mavutil.mavlink_connection(self.master.address)
+        # Re-register so the reactor waits on the new file descriptor
+        if self._reactor is not None:
+            self._reactor.add(self)
 
     def fix_targets(self, message: Any) -> None:
         """Set correct target IDs for our vehicle."""
-        if hasattr(message, "target_system"):
+        cls = type(message)
+        has_target = MAVConnection._HAS_TARGET_SYSTEM.get(cls)
+        if has_target is None:
+            has_target = hasattr(message, "target_system")
+            MAVConnection._HAS_TARGET_SYSTEM[cls] = has_target
+        if has_target:
             message.target_system = self.target_system
 
     def forward_loop(self, fn: LoopCallback) -> LoopCallback:
@@ -397,33 +797,76 @@ class MAVConnection:
         Decorator for event loop callbacks.
 
         The callback is called on each iteration of the message loop.
+        Register through this method rather than appending to
+        ``loop_listeners`` so the input thread picks the callback up.
         """
         self.loop_listeners.append(fn)
+        self._listeners_version += 1
         return fn
 
-    def forward_message(self, fn: MessageCallback) -> MessageCallback:
+    def forward_message(
+        self,
+        fn: MessageCallback | None = None,
+        msg_type: str | None = None,
+    ) -> Any:
         """
         Decorator for message callbacks.
 
-        The callback is called for each received message.
+        The callback is called for each received message, or only for
+        messages of `msg_type` when given. Register through this method
+        rather than appending to ``message_listeners`` so the input thread
+        picks the callback up.
+
+        Args:
+            fn: The callback; omit to use as ``@forward_message(msg_type=...)``
+            msg_type: MAVLink message type to filter on (None = all)
+
+        Returns:
+            The callback, or a decorator if `fn` was omitted
+        """
+
+        def register(fn: MessageCallback) -> MessageCallback:
+            if msg_type is None:
+                self.message_listeners.append(fn)
+            else:
+                self._listeners_by_type.setdefault(msg_type, []).append(fn)
+            self._listeners_version += 1
+            return fn
+
+        if fn is None:
+            return register
+        return register(fn)
+
+    def forward_message_batch(self, fn: BatchCallback) -> BatchCallback:
         """
-        self.message_listeners.append(fn)
+        Decorator for callbacks that take received messages in bursts.
+
+        The callback is called with the list of messages read in one go,
+        after the per-message listeners have seen them, so per-burst work
+        is paid once rather than per message. The list must not be kept.
+        """
+        self._batch_listeners.append(fn)
+        self._listeners_version += 1
         return fn
 
     def start(self) -> None:
         """Start the I/O threads."""
-        if self.mavlink_thread_in and not self.mavlink_thread_in.is_alive():
+        if self.mavlink_thread_in is None:
+            if self._reactor is None and self._alive:
+                self._reactor = _get_reactor()
+                self._reactor.add(self)
+        elif not self.mavlink_thread_in.is_alive():
             self.mavlink_thread_in.start()
         if self.mavlink_thread_out and not self.mavlink_thread_out.is_alive():
             self.mavlink_thread_out.start()
 
     def close(self) -> None:
         """Close the connection."""
+        # Let the output thread flush queued packets before stopping it
+        writer = self.mavlink_thread_out
+        if writer is not None and writer.is_alive():
+            self.out_queue.join(_CLOSE_DRAIN_TIMEOUT)
         self._alive = False
-        # Wait for output queue to drain
-        timeout = time.monotonic() + 5.0
-        while not self.out_queue.empty() and time.monotonic() < timeout:
-            time.sleep(0.1)
         self.stop_threads()
         self.master.close()
 
@@ -443,21 +886,26 @@ class MAVConnection:
         @self.forward_message
         def callback_to_target(_: MAVConnection, msg: Any) -> None:
             try:
-                target.out_queue.put(msg.pack(target.master.mav))
+                # Forward the received bytes as-is; only re-pack when the
+                # target speaks a different MAVLink version
+                buf = msg.get_msgbuf()
+                mav = target.master.mav
+                if buf and buf[0] == getattr(mav, "protocol_marker", buf[0]):
+                    target.out_queue.put(buf)
+                else:
+                    target.out_queue.put(msg.pack(mav))
             except Exception:
-                try:
-                    assert len(msg.get_msgbuf()) > 0
-                    target.out_queue.put(msg.get_msgbuf())
-                except Exception:
-                    self._logger.exception(
-                        "Could not pack this object on receive: %s",
-                        type(msg),
-                        exc_info=True,
-                    )
+                self._logger.exception(
+                    "Could not pack this object on receive: %s",
+                    type(msg),
+                    exc_info=True,
+                )
 
         # target -> self -> vehicle
         @target.forward_message
         def callback_from_target(_: MAVConnection, msg: Any) -> None:
+            # pack() rewrites the header, buffer and sequence ids as well as
+            # the target, so work on a copy the target's listeners never see
             msg = copy.copy(msg)
             target.fix_targets(msg)
             try:
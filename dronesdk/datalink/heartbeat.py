@@ -6,19 +6,195 @@ This module provides heartbeat monitoring for MAVLink connections.
 
 from __future__ import annotations
 
+import functools
 import logging
-import time
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable
+from time import monotonic as _monotonic
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
-import monotonic
+from pymavlink import mavutil
+
+from dronesdk.core.events import EventPriority
 
 if TYPE_CHECKING:
-    from dronesdk.core.events import EventBus
+    from dronesdk.core.events import EventBus, MAVLinkMessageEvent
     from dronesdk.datalink.connection import MAVConnection
 
 logger = logging.getLogger(__name__)
 
+# Heartbeats from these component types do not come from the vehicle
+_IGNORED_HB_TYPES = frozenset(
+    (
+        mavutil.mavlink.MAV_TYPE_GCS,
+        mavutil.mavlink.MAV_TYPE_GIMBAL,
+        mavutil.mavlink.MAV_TYPE_ADSB,
+        mavutil.mavlink.MAV_TYPE_ONBOARD_CONTROLLER,
+    )
+)
+_ARMED_FLAG = mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED
+_AP_PX4 = mavutil.mavlink.MAV_AUTOPILOT_PX4
+
+ModeResolver = Callable[[int, int], str]
+
+# Mode name resolver per (autopilot, vehicle_type), and decoded mode name per
+# (autopilot, vehicle_type, base_mode, custom_mode). Both only grow by the
+# few combinations a vehicle actually reports.
+_MODE_RESOLVERS: dict[tuple[int, int], ModeResolver] = {}
+_MODE_NAMES: dict[tuple[int, int, int, int], str] = {}
+
+
+def _make_mode_resolver(autopilot: int, vehicle_type: int) -> ModeResolver:
+    """
+    Build the function decoding a mode name from (base_mode, custom_mode).
+
+    The PX4-or-ArduPilot choice and the mode mapping lookup are made here,
+    once per autopilot and vehicle type, not for every decoded mode.
+    """
+    if autopilot == _AP_PX4:
+        return mavutil.interpret_px4_mode
+    mode_mapping = mavutil.mode_mapping_bynumber(vehicle_type) or {}
+
+    def resolve(base_mode: int, custom_mode: int) -> str:
+        return mode_mapping.get(custom_mode, "UNKNOWN")
+
+    return resolve
+
+
+def _decode_mode_name(
+    autopilot: int, vehicle_type: int, base_mode: int, custom_mode: int
+) -> str:
+    """Decode the flight mode name from HEARTBEAT fields."""
+    resolver = _MODE_RESOLVERS.get((autopilot, vehicle_type))
+    if resolver is None:
+        resolver = _make_mode_resolver(autopilot, vehicle_type)
+        _MODE_RESOLVERS[(autopilot, vehicle_type)] = resolver
+    return resolver(base_mode, custom_mode)
+
+
+class VehicleHeartbeatEvent(NamedTuple):
+    """
+    A HEARTBEAT from the vehicle, decoded once for all subscribers.
+
+    Attributes:
+        timestamp: Monotonic timestamp when the message was received
+        armed: Whether the safety armed flag is set
+        mode_name: Flight mode name (e.g., 'GUIDED')
+        autopilot: The MAV_AUTOPILOT value
+        vehicle_type: The MAV_TYPE value
+        message: The raw HEARTBEAT message
+    """
+
+    timestamp: float
+    armed: bool
+    mode_name: str
+    autopilot: int
+    vehicle_type: int
+    message: Any
+
+
+VehicleHeartbeatHandler = Callable[[VehicleHeartbeatEvent], None]
+
+
+class VehicleHeartbeatFilter:
+    """
+    Single HEARTBEAT subscriber shared by the modules that track the vehicle.
+
+    Heartbeats from other components (GCS, gimbal, ADS-B, companion
+    computers) are dropped, and vehicle heartbeats are decoded once into a
+    VehicleHeartbeatEvent handed to every subscriber on the publishing
+    thread.
+
+    Example:
+        >>> heartbeat_filter = VehicleHeartbeatFilter()
+        >>> heartbeat_filter.attach(event_bus)
+        >>> unsubscribe = heartbeat_filter.subscribe(
+        ...     lambda hb: print(hb.mode_name, hb.armed)
+        ... )
+    """
+
+    __slots__ = ("_handlers", "_lock", "_unsubscribe")
+
+    def __init__(self) -> None:
+        # Replaced, never mutated, so dispatch can iterate it without locking
+        self._handlers: tuple[VehicleHeartbeatHandler, ...] = ()
+        self._lock = threading.Lock()
+        self._unsubscribe: Callable[[], None] | None = None
+
+    def attach(self, event_bus: "EventBus") -> None:
+        """
+        Attach to an event bus to receive heartbeat messages.
+
+        Args:
+            event_bus: The event bus to subscribe to
+        """
+        self._unsubscribe = event_bus.subscribe_message(
+            "HEARTBEAT",
+            self._handle_heartbeat,
+            priority=EventPriority.HIGH,
+        )
+
+    def detach(self) -> None:
+        """Detach from the event bus."""
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def subscribe(self, handler: VehicleHeartbeatHandler) -> Callable[[], None]:
+        """
+        Subscribe to vehicle heartbeats.
+
+        Args:
+            handler: Callback function that receives VehicleHeartbeatEvent
+
+        Returns:
+            Unsubscribe function - call it to remove the subscription
+        """
+        with self._lock:
+            self._handlers = (*self._handlers, handler)
+        return functools.partial(self._remove, handler)
+
+    def _remove(self, handler: VehicleHeartbeatHandler) -> None:
+        """Remove a subscribed handler; unknown handlers are ignored."""
+        with self._lock:
+            handlers = list(self._handlers)
+            if handler in handlers:
+                handlers.remove(handler)
+                self._handlers = tuple(handlers)
+
+    def _handle_heartbeat(self, event: "MAVLinkMessageEvent") -> None:
+        """Decode a vehicle HEARTBEAT and pass it to the subscribers."""
+        msg = event.message
+        vehicle_type = msg.type
+        if vehicle_type in _IGNORED_HB_TYPES:
+            return
+        handlers = self._handlers
+        if not handlers:
+            return
+
+        autopilot = msg.autopilot
+        base_mode = msg.base_mode
+        custom_mode = msg.custom_mode
+        key = (autopilot, vehicle_type, base_mode, custom_mode)
+        mode_name = _MODE_NAMES.get(key)
+        if mode_name is None:
+            mode_name = _decode_mode_name(*key)
+            _MODE_NAMES[key] = mode_name
+
+        heartbeat = VehicleHeartbeatEvent(
+            event.timestamp,
+            (base_mode & _ARMED_FLAG) != 0,
+            mode_name,
+            autopilot,
+            vehicle_type,
+            msg,
+        )
+        for handler in handlers:
+            try:
+                handler(heartbeat)
+            except Exception:
+                logger.exception("Error in vehicle heartbeat handler")
+
 
 @dataclass
 class HeartbeatStatus:
@@ -32,6 +208,15 @@ class HeartbeatStatus:
         time_since_last: Seconds since last heartbeat
     """
 
+    # Written out rather than dataclass(slots=True), which needs Python 3.10.
+    # This works because no field has a default.
+    __slots__ = (
+        "last_heartbeat",
+        "last_heartbeat_raw",
+        "is_connected",
+        "time_since_last",
+    )
+
     last_heartbeat: float | None
     last_heartbeat_raw: Any | None
     is_connected: bool
@@ -45,10 +230,16 @@ class HeartbeatManager:
     The manager tracks incoming HEARTBEAT messages and maintains
     connection status based on configurable timeout.
 
+    State changes are reported to on_state_change(connected), then to
+    on_connect or on_disconnect. A lost connection is detected by a
+    watchdog thread, which only runs while connected and only when a
+    disconnect callback is set.
+
     Args:
         timeout: Seconds without heartbeat before connection is dead
         on_connect: Callback when connection is established
         on_disconnect: Callback when connection is lost
+        on_state_change: Callback with the new state when either happens
     """
 
     __slots__ = (
@@ -57,10 +248,14 @@ class HeartbeatManager:
         "_last_heartbeat_raw",
         "_on_connect",
         "_on_disconnect",
-        "_was_connected",
+        "_on_state_change",
+        "_state_lock",
+        "_watchdog",
+        "_watchdog_stop",
         "_target_system",
         "_target_component",
         "_unsubscribe",
+        "_heartbeat_event",
     )
 
     def __init__(
@@ -68,33 +263,50 @@ class HeartbeatManager:
         timeout: float = 5.0,
         on_connect: Callable[[], None] | None = None,
         on_disconnect: Callable[[], None] | None = None,
+        on_state_change: Callable[[bool], None] | None = None,
     ) -> None:
         self._timeout = timeout
         self._last_heartbeat: float | None = None
         self._last_heartbeat_raw: Any | None = None
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
-        self._was_connected = False
+        self._on_state_change = on_state_change
+        # Orders the connect/disconnect reports of the heartbeat and
+        # watchdog threads
+        self._state_lock = threading.Lock()
+        # Watchdog thread; set from a reported connect until the matching
+        # disconnect is reported
+        self._watchdog: threading.Thread | None = None
+        # Set by detach() to stop the running watchdog without a report
+        self._watchdog_stop = threading.Event()
         self._target_system: int | None = None
         self._target_component: int | None = None
         self._unsubscribe: Callable[[], None] | None = None
+        # Set by every vehicle heartbeat; wait_for_connection clears it first
+        self._heartbeat_event = threading.Event()
 
-    def attach(self, event_bus: "EventBus") -> None:
+    def attach(
+        self,
+        event_bus: "EventBus",
+        heartbeat_filter: VehicleHeartbeatFilter | None = None,
+    ) -> None:
         """
         Attach to an event bus to receive heartbeat messages.
 
         Args:
             event_bus: The event bus to subscribe to
+            heartbeat_filter: Shared filter already attached to the bus.
+                If omitted, a private one is created.
         """
-        from dronesdk.core.events import MAVLinkMessageEvent
-
-        def handle_heartbeat(event: MAVLinkMessageEvent) -> None:
-            self._handle_heartbeat(event.message)
-
-        self._unsubscribe = event_bus.subscribe_message(
-            "HEARTBEAT",
-            handle_heartbeat,
-        )
+        if heartbeat_filter is None:
+            heartbeat_filter = VehicleHeartbeatFilter()
+            heartbeat_filter.attach(event_bus)
+            heartbeat_filter.subscribe(self._handle_vehicle_heartbeat)
+            self._unsubscribe = heartbeat_filter.detach
+        else:
+            self._unsubscribe = heartbeat_filter.subscribe(
+                self._handle_vehicle_heartbeat
+            )
 
     def attach_to_connection(self, handler: "MAVConnection") -> None:
         """
@@ -104,61 +316,115 @@ class HeartbeatManager:
             handler: The MAVConnection to monitor
         """
 
-        @handler.forward_message
+        @handler.forward_message(msg_type="HEARTBEAT")
         def on_message(_: Any, msg: Any) -> None:
-            if msg.get_type() == "HEARTBEAT":
-                self._handle_heartbeat(msg)
+            self._handle_heartbeat(msg)
 
     def detach(self) -> None:
-        """Detach from the event bus."""
+        """Detach from the event bus and stop the watchdog thread."""
         if self._unsubscribe:
             self._unsubscribe()
             self._unsubscribe = None
 
+        # Not joined: the state callbacks run under _state_lock and may
+        # call detach() themselves. The watchdog checks the event under
+        # that lock, so only a report already under way can still finish.
+        self._watchdog_stop.set()
+        self._watchdog = None
+
+    def _handle_vehicle_heartbeat(self, heartbeat: VehicleHeartbeatEvent) -> None:
+        """Handle a heartbeat already filtered by VehicleHeartbeatFilter."""
+        self._record_heartbeat(heartbeat.message)
+
     def _handle_heartbeat(self, msg: Any) -> None:
         """Handle an incoming heartbeat message."""
-        from pymavlink import mavutil
-
         # Ignore non-vehicle heartbeats (GCS, etc.)
-        if msg.type in (
-            mavutil.mavlink.MAV_TYPE_GCS,
-            mavutil.mavlink.MAV_TYPE_GIMBAL,
-            mavutil.mavlink.MAV_TYPE_ADSB,
-            mavutil.mavlink.MAV_TYPE_ONBOARD_CONTROLLER,
-        ):
+        if msg.type in _IGNORED_HB_TYPES:
             return
-
-        was_connected = self.is_connected
-        self._last_heartbeat = monotonic.monotonic()
+        self._record_heartbeat(msg)
+
+    def _record_heartbeat(self, msg: Any) -> None:
+        """Record a vehicle heartbeat and notify connection changes."""
+        # One clock read serves both the previous state and the new timestamp
+        now = _monotonic()
+        last_heartbeat = self._last_heartbeat
+        was_connected = (
+            last_heartbeat is not None and (now - last_heartbeat) < self._timeout
+        )
+        self._last_heartbeat = now
         self._last_heartbeat_raw = msg
+        if not self._heartbeat_event.is_set():
+            self._heartbeat_event.set()
 
         # Track the first heartbeat for target system
         if self._target_system is None:
             self._target_system = msg.get_srcSystem()
             self._target_component = msg.get_srcComponent()
 
-        # Notify on connection state change
-        if not was_connected and self.is_connected:
-            self._was_connected = True
-            if self._on_connect:
-                try:
-                    self._on_connect()
-                except Exception:
-                    logger.exception("Error in on_connect callback")
-        elif was_connected and not self.is_connected:
-            self._was_connected = False
-            if self._on_disconnect:
-                try:
-                    self._on_disconnect()
-                except Exception:
-                    logger.exception("Error in on_disconnect callback")
+        # A heartbeat was just received, so the link is up now whatever its
+        # previous state; only a change needs more work
+        if not was_connected:
+            self._connection_up()
+
+    def _connection_up(self) -> None:
+        """Report a connection, unless it was never reported lost."""
+        # Reports are made under the lock so a disconnect from the watchdog
+        # cannot overtake the connect that follows it
+        with self._state_lock:
+            if self._watchdog is not None:
+                # Late heartbeat: the watchdog has not declared it lost yet
+                return
+            if self._on_disconnect or self._on_state_change:
+                # Each watchdog gets its own stop event, so one stopped by
+                # an earlier detach() cannot stop this one
+                stop = self._watchdog_stop = threading.Event()
+                self._watchdog = threading.Thread(
+                    target=self._watch_heartbeats,
+                    args=(stop,),
+                    name="HeartbeatWatchdog",
+                    daemon=True,
+                )
+                self._watchdog.start()
+            self._notify_state(True)
+
+    def _watch_heartbeats(self, stop: threading.Event) -> None:
+        """Watchdog thread: report the connection lost on heartbeat timeout."""
+        while True:
+            with self._state_lock:
+                if stop.is_set():
+                    return
+                last_heartbeat = self._last_heartbeat or 0.0
+                remaining = last_heartbeat + self._timeout - _monotonic()
+                if remaining <= 0:
+                    self._watchdog = None
+                    self._notify_state(False)
+                    return
+            stop.wait(remaining)
+
+    def _notify_state(self, connected: bool) -> None:
+        """Call the state callbacks for a connect or disconnect."""
+        if self._on_state_change:
+            try:
+                self._on_state_change(connected)
+            except Exception:
+                logger.exception("Error in on_state_change callback")
+
+        if connected:
+            callback, name = self._on_connect, "on_connect"
+        else:
+            callback, name = self._on_disconnect, "on_disconnect"
+        if callback:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error in %s callback", name)
 
     @property
     def is_connected(self) -> bool:
         """Check if connection is active (received heartbeat within timeout)."""
         if self._last_heartbeat is None:
             return False
-        return (monotonic.monotonic() - self._last_heartbeat) < self._timeout
+        return (_monotonic() - self._last_heartbeat) < self._timeout
 
     @property
     def last_heartbeat(self) -> float | None:
@@ -175,7 +441,7 @@ class HeartbeatManager:
         """Get seconds since last heartbeat."""
         if self._last_heartbeat is None:
             return None
-        return monotonic.monotonic() - self._last_heartbeat
+        return _monotonic() - self._last_heartbeat
 
     @property
     def target_system(self) -> int | None:
@@ -206,9 +472,9 @@ class HeartbeatManager:
         Returns:
             True if connection established, False if timed out
         """
-        start = monotonic.monotonic()
-        while not self.is_connected:
-            if (monotonic.monotonic() - start) > timeout:
-                return False
-            time.sleep(0.1)
-        return True
+        # Cleared before checking, so a heartbeat arriving in between
+        # still wakes the wait below
+        self._heartbeat_event.clear()
+        if self.is_connected:
+            return True
+        return self._heartbeat_event.wait(timeout)
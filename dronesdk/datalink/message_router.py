@@ -8,9 +8,10 @@ routing incoming MAVLink messages to the event system.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from time import monotonic as _monotonic
+from typing import TYPE_CHECKING, Any, Callable
 
-import monotonic
+from dronesdk.core.events import EventPriority, MAVLinkMessageEvent
 
 if TYPE_CHECKING:
     from dronesdk.core.events import EventBus
@@ -31,7 +32,13 @@ class MessageRouter:
         event_bus: The EventBus to publish events to
     """
 
-    __slots__ = ("_connection", "_event_bus", "_attached")
+    __slots__ = (
+        "_connection",
+        "_event_bus",
+        "_attached",
+        "_min_interval",
+        "_last_publish",
+    )
 
     def __init__(
         self,
@@ -41,6 +48,10 @@ class MessageRouter:
         self._connection = connection
         self._event_bus = event_bus
         self._attached = False
+        # message_type -> minimum seconds between published messages
+        self._min_interval: dict[str, float] = {}
+        # message_type -> time a rate limited type was last published
+        self._last_publish: dict[str, float] = {}
 
     def attach(self) -> None:
         """
@@ -52,23 +63,58 @@ class MessageRouter:
         if self._attached:
             return
 
-        @self._connection.forward_message
-        def on_message(_: "MAVConnection", msg: Any) -> None:
-            self._route_message(msg)
-
+        # Messages arrive in bursts; publishing a burst at once reads the
+        # bus snapshot and queues deferred work once per burst
+        self._connection.forward_message_batch(self._route_messages)
         self._attached = True
         logger.debug("MessageRouter attached to connection")
 
-    def _route_message(self, msg: Any) -> None:
-        """Route a MAVLink message to the event bus."""
-        from dronesdk.core.events import MAVLinkMessageEvent
+    def set_rate_limit(self, message_type: str, hz: float | None) -> None:
+        """
+        Limit how often a message type is published to the event bus.
 
-        event = MAVLinkMessageEvent(
-            timestamp=monotonic.monotonic(),
-            message_type=msg.get_type(),
-            message=msg,
-        )
-        self._event_bus.publish_message(event)
+        Messages of the type arriving sooner than 1/hz seconds after the
+        last published one are dropped before an event is built. The
+        limit applies to every subscriber, so do not throttle messages
+        the vehicle modules depend on, such as HEARTBEAT.
+
+        Args:
+            message_type: MAVLink message type (e.g., 'GLOBAL_POSITION_INT')
+            hz: Maximum publish rate; None or a value <= 0 removes the limit
+        """
+        if hz is None or hz <= 0:
+            self._min_interval.pop(message_type, None)
+            self._last_publish.pop(message_type, None)
+        else:
+            self._min_interval[message_type] = 1.0 / hz
+
+    def _route_messages(self, _: "MAVConnection", msgs: list[Any]) -> None:
+        """Route a burst of MAVLink messages to the event bus."""
+        event_bus = self._event_bus
+        # Don't build events nobody will receive. Without wildcard handlers,
+        # only the subscribed types are; None lets every type through.
+        subscribed_types: frozenset[str] | None = None
+        if not event_bus.has_wildcard:
+            subscribed_types = event_bus.subscribed_types
+            if not subscribed_types:
+                return
+        min_interval = self._min_interval
+        last_publish = self._last_publish
+        now = _monotonic()
+        events = []
+        for msg in msgs:
+            message_type = msg.get_type()
+            if subscribed_types is not None and message_type not in subscribed_types:
+                continue
+            if min_interval:
+                interval = min_interval.get(message_type)
+                if interval is not None:
+                    if now - last_publish.get(message_type, -interval) < interval:
+                        continue
+                    last_publish[message_type] = now
+            events.append(MAVLinkMessageEvent(now, message_type, msg))
+        if events:
+            event_bus.publish_message_batch(events)
 
     def detach(self) -> None:
         """
@@ -86,6 +132,25 @@ class MessageRouter:
         return self._attached
 
 
+def _pop_unsubscribe(
+    listeners: dict[Any, list[Callable[[], None]]],
+    callback: Any,
+) -> bool:
+    """
+    Unsubscribe the oldest registration of a callback.
+
+    Returns:
+        True if the callback was registered
+    """
+    unsubscribes = listeners.get(callback)
+    if not unsubscribes:
+        return False
+    unsubscribes.pop(0)()
+    if not unsubscribes:
+        del listeners[callback]
+    return True
+
+
 class LegacyMessageAdapter:
     """
     Adapter for legacy message listener patterns.
@@ -101,8 +166,11 @@ class LegacyMessageAdapter:
 
     def __init__(self, event_bus: "EventBus") -> None:
         self._event_bus = event_bus
-        self._listeners: dict[str, list[Any]] = {}
-        self._unsubscribe_all: list[Any] = []
+        # message_type -> callback -> unsubscribe functions, one per time
+        # the callback was added. Keyed by the callback itself rather than
+        # id(): bound methods are new objects on every attribute access.
+        self._listeners: dict[str, dict[Any, list[Callable[[], None]]]] = {}
+        self._unsubscribe_all: dict[Any, list[Callable[[], None]]] = {}
 
     def add_message_listener(
         self,
@@ -118,7 +186,6 @@ class LegacyMessageAdapter:
             callback: Callback function with signature (vehicle, name, msg)
             vehicle: Vehicle instance to pass to callback
         """
-        from dronesdk.core.events import MAVLinkMessageEvent
 
         def adapter(event: MAVLinkMessageEvent) -> None:
             try:
@@ -129,11 +196,14 @@ class LegacyMessageAdapter:
                     message_type,
                 )
 
-        unsubscribe = self._event_bus.subscribe_message(message_type, adapter)
+        # NORMAL priority: user callbacks run on the event bus worker
+        # thread rather than the MAVLink reader thread
+        unsubscribe = self._event_bus.subscribe_message(
+            message_type, adapter, priority=EventPriority.NORMAL
+        )
 
-        if message_type not in self._listeners:
-            self._listeners[message_type] = []
-        self._listeners[message_type].append((callback, unsubscribe))
+        listeners = self._listeners.setdefault(message_type, {})
+        listeners.setdefault(callback, []).append(unsubscribe)
 
     def remove_message_listener(
         self,
@@ -147,16 +217,10 @@ class LegacyMessageAdapter:
             message_type: MAVLink message type
             callback: The callback function to remove
         """
-        if message_type not in self._listeners:
+        listeners = self._listeners.get(message_type)
+        if listeners is None or not _pop_unsubscribe(listeners, callback):
             return
-
-        for cb, unsub in self._listeners[message_type]:
-            if cb == callback:
-                unsub()
-                self._listeners[message_type].remove((cb, unsub))
-                break
-
-        if not self._listeners[message_type]:
+        if not listeners:
             del self._listeners[message_type]
 
     def add_wildcard_listener(self, callback: Any, vehicle: Any) -> None:
@@ -167,7 +231,6 @@ class LegacyMessageAdapter:
             callback: Callback function with signature (vehicle, name, msg)
             vehicle: Vehicle instance to pass to callback
         """
-        from dronesdk.core.events import MAVLinkMessageEvent
 
         def adapter(event: MAVLinkMessageEvent) -> None:
             try:
@@ -178,24 +241,31 @@ class LegacyMessageAdapter:
                     event.message_type,
                 )
 
-        unsubscribe = self._event_bus.subscribe_all_messages(adapter)
-        self._unsubscribe_all.append((callback, unsubscribe))
+        unsubscribe = self._event_bus.subscribe_all_messages(
+            adapter, priority=EventPriority.NORMAL
+        )
+        self._unsubscribe_all.setdefault(callback, []).append(unsubscribe)
 
     def remove_wildcard_listener(self, callback: Any) -> None:
         """Remove a wildcard listener."""
-        for cb, unsub in self._unsubscribe_all:
-            if cb == callback:
-                unsub()
-                self._unsubscribe_all.remove((cb, unsub))
-                break
+        _pop_unsubscribe(self._unsubscribe_all, callback)
 
     def clear(self) -> None:
         """Remove all listeners."""
-        for listeners in self._listeners.values():
-            for _, unsub in listeners:
-                unsub()
+        all_unsubscribes = [
+            unsub
+            for listeners in self._listeners.values()
+            for unsubscribes in listeners.values()
+            for unsub in unsubscribes
+        ]
+        for unsubscribes in self._unsubscribe_all.values():
+            all_unsubscribes.extend(unsubscribes)
         self._listeners.clear()
-
-        for _, unsub in self._unsubscribe_all:
-            unsub()
         self._unsubscribe_all.clear()
+
+        # One failure must not leave the remaining listeners subscribed
+        for unsub in all_unsubscribes:
+            try:
+                unsub()
+            except Exception:
+                logger.exception("Error removing message listener")
@@ -8,13 +8,17 @@ arming, takeoff, and navigation.
 from dronesdk.flight_control.controller import FlightController
 from dronesdk.flight_control.navigation import (
     get_distance_metres,
+    get_distances_metres,
     get_location_metres,
+    get_locations_metres,
     get_bearing,
 )
 
 __all__ = [
     "FlightController",
     "get_distance_metres",
+    "get_distances_metres",
     "get_location_metres",
+    "get_locations_metres",
     "get_bearing",
 ]
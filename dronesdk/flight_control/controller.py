@@ -9,21 +9,37 @@ from __future__ import annotations
 
 import logging
 import time
+from time import monotonic as _monotonic
 from typing import TYPE_CHECKING, Any, Callable
 
-import monotonic
 from pymavlink import mavutil
 
+from dronesdk.core.events import AttributeChangedEvent
 from dronesdk.core.exceptions import APIException
+from dronesdk.datalink.heartbeat import VehicleHeartbeatEvent, VehicleHeartbeatFilter
 from dronesdk.models.location import LocationGlobal, LocationGlobalRelative
 from dronesdk.models.status import VehicleMode
 
 if TYPE_CHECKING:
-    from dronesdk.core.events import EventBus, MAVLinkMessageEvent
+    from dronesdk.core.events import EventBus
     from dronesdk.datalink.connection import MAVConnection
 
 logger = logging.getLogger(__name__)
 
+_AP_PX4 = mavutil.mavlink.MAV_AUTOPILOT_PX4
+_CMD_SET_MODE = mavutil.mavlink.MAV_CMD_DO_SET_MODE
+_CUSTOM_MODE_ENABLED = mavutil.mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED
+_CMD_TAKEOFF = mavutil.mavlink.MAV_CMD_NAV_TAKEOFF
+_CMD_CHANGE_SPEED = mavutil.mavlink.MAV_CMD_DO_CHANGE_SPEED
+_CMD_CONDITION_YAW = mavutil.mavlink.MAV_CMD_CONDITION_YAW
+_CMD_NAV_WAYPOINT = mavutil.mavlink.MAV_CMD_NAV_WAYPOINT
+_FRAME_GLOBAL = mavutil.mavlink.MAV_FRAME_GLOBAL
+_FRAME_LOCAL_NED = mavutil.mavlink.MAV_FRAME_LOCAL_NED
+_FRAME_GLOBAL_RELATIVE_ALT_INT = mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT_INT
+
+# SET_POSITION_TARGET_* type_mask using only the velocity fields
+_VEL_ONLY_MASK = 0b0000111111000111
+
 
 class FlightController:
     """
@@ -36,6 +52,9 @@ class FlightController:
     - Goto (position navigation)
     - Velocity commands
 
+    Mode and armed changes are published on the event bus as
+    AttributeChangedEvent ('mode' / 'armed'), including the first value.
+
     Args:
         on_mode_change: Optional callback when mode changes
         on_armed_change: Optional callback when armed state changes
@@ -43,13 +62,16 @@ class FlightController:
 
     __slots__ = (
         "_connection",
+        "_command_long_send",
         "_mode",
         "_armed",
         "_autopilot_type",
         "_vehicle_type",
         "_on_mode_change",
         "_on_armed_change",
+        "_event_bus",
         "_unsubscribe_fns",
+        "_mode_ids",
     )
 
     def __init__(
@@ -58,13 +80,18 @@ class FlightController:
         on_armed_change: Callable[[bool], None] | None = None,
     ) -> None:
         self._connection: MAVConnection | None = None
+        # master.mav.command_long_send, bound once per connection
+        self._command_long_send: Callable[..., None] | None = None
         self._mode: VehicleMode | None = None
         self._armed: bool | None = None
         self._autopilot_type: int | None = None
         self._vehicle_type: int | None = None
         self._on_mode_change = on_mode_change
         self._on_armed_change = on_armed_change
+        self._event_bus: EventBus | None = None
         self._unsubscribe_fns: list[Callable[[], None]] = []
+        # ArduPilot mode name -> custom mode number, per vehicle type
+        self._mode_ids: dict[int | None, dict[str, int]] = {}
 
     @property
     def name(self) -> str:
@@ -74,18 +101,28 @@ class FlightController:
     def set_connection(self, connection: "MAVConnection") -> None:
         """Set the MAVLink connection."""
         self._connection = connection
+        self._command_long_send = connection.master.mav.command_long_send
+        self._mode_ids.clear()
 
-    def attach(self, event_bus: "EventBus") -> None:
+    def attach(
+        self,
+        event_bus: "EventBus",
+        heartbeat_filter: VehicleHeartbeatFilter | None = None,
+    ) -> None:
         """
         Attach to an event bus to receive flight-related messages.
 
         Args:
             event_bus: The event bus to subscribe to
+            heartbeat_filter: Shared filter already attached to the bus.
+                If omitted, a private one is created.
         """
-        unsub = event_bus.subscribe_message(
-            "HEARTBEAT",
-            self._handle_heartbeat,
-        )
+        self._event_bus = event_bus
+        if heartbeat_filter is None:
+            heartbeat_filter = VehicleHeartbeatFilter()
+            heartbeat_filter.attach(event_bus)
+            self._unsubscribe_fns.append(heartbeat_filter.detach)
+        unsub = heartbeat_filter.subscribe(self._handle_heartbeat)
         self._unsubscribe_fns.append(unsub)
         logger.debug("FlightController attached to event bus")
 
@@ -94,61 +131,51 @@ class FlightController:
         for unsub in self._unsubscribe_fns:
             unsub()
         self._unsubscribe_fns.clear()
+        self._event_bus = None
         logger.debug("FlightController detached from event bus")
 
     def initialize(self) -> None:
         """Initialize the module."""
         pass
 
-    def _handle_heartbeat(self, event: "MAVLinkMessageEvent") -> None:
-        """Handle HEARTBEAT message for mode and armed updates."""
-        msg = event.message
-
-        # Ignore non-vehicle heartbeats
-        if msg.type in (
-            mavutil.mavlink.MAV_TYPE_GCS,
-            mavutil.mavlink.MAV_TYPE_GIMBAL,
-            mavutil.mavlink.MAV_TYPE_ADSB,
-            mavutil.mavlink.MAV_TYPE_ONBOARD_CONTROLLER,
-        ):
-            return
-
-        self._autopilot_type = msg.autopilot
-        self._vehicle_type = msg.type
+    def _handle_heartbeat(self, heartbeat: VehicleHeartbeatEvent) -> None:
+        """Handle a vehicle HEARTBEAT for mode and armed updates."""
+        self._autopilot_type = heartbeat.autopilot
+        self._vehicle_type = heartbeat.vehicle_type
 
-        # Update armed state
-        new_armed = bool(msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED)
-        if self._armed != new_armed:
+        # Update armed state; it rarely changes, so test that case first
+        new_armed = heartbeat.armed
+        if new_armed != self._armed:
             old_armed = self._armed
             self._armed = new_armed
+            self._publish_change("armed", old_armed, new_armed)
             if old_armed is not None and self._on_armed_change:
                 try:
                     self._on_armed_change(new_armed)
                 except Exception:
                     logger.exception("Error in armed change callback")
 
-        # Update mode
-        if self._autopilot_type == mavutil.mavlink.MAV_AUTOPILOT_PX4:
-            mode_name = mavutil.interpret_px4_mode(
-                msg.base_mode,
-                msg.custom_mode,
-            )
-        else:
-            mode_mapping = mavutil.mode_mapping_bynumber(self._vehicle_type)
-            if mode_mapping:
-                mode_name = mode_mapping.get(msg.custom_mode, "UNKNOWN")
-            else:
-                mode_name = "UNKNOWN"
-
+        # Update mode; a VehicleMode is only built on a mode switch
+        mode_name = heartbeat.mode_name
         if self._mode is None or self._mode.name != mode_name:
             old_mode = self._mode
             self._mode = VehicleMode.from_mavlink(mode_name)
+            self._publish_change("mode", old_mode, self._mode)
             if old_mode is not None and self._on_mode_change:
                 try:
                     self._on_mode_change(self._mode)
                 except Exception:
                     logger.exception("Error in mode change callback")
 
+    def _publish_change(self, name: str, old_value: Any, new_value: Any) -> None:
+        """Publish a mode or armed change on the event bus."""
+        if self._event_bus is not None:
+            self._event_bus.publish_attribute_change(
+                AttributeChangedEvent(
+                    _monotonic(), name, old_value, new_value
+                )
+            )
+
     @property
     def mode(self) -> VehicleMode | None:
         """Get current vehicle mode."""
@@ -175,17 +202,17 @@ class FlightController:
             mode_name = value.name
 
         # Get mode mapping
-        if self._autopilot_type == mavutil.mavlink.MAV_AUTOPILOT_PX4:
+        if self._autopilot_type == _AP_PX4:
             # PX4 mode setting
             mode_id = mavutil.interpret_px4_mode(mode_name)
             if mode_id is None:
                 raise ValueError(f"Unknown mode: {mode_name}")
-            self._connection.master.mav.command_long_send(
+            self._command_long_send(
                 self._connection.target_system,
                 0,  # component
-                mavutil.mavlink.MAV_CMD_DO_SET_MODE,
+                _CMD_SET_MODE,
                 0,  # confirmation
-                mavutil.mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED,
+                _CUSTOM_MODE_ENABLED,
                 mode_id,
                 0,
                 0,
@@ -195,11 +222,17 @@ class FlightController:
             )
         else:
             # ArduPilot mode setting
-            mode_mapping = mavutil.mode_mapping_byname(self._vehicle_type)
-            if mode_mapping is None or mode_name.upper() not in mode_mapping:
-                raise ValueError(f"Unknown mode: {mode_name}")
+            mode_ids = self._mode_ids.get(self._vehicle_type)
+            if mode_ids is None:
+                mode_ids = mavutil.mode_mapping_byname(self._vehicle_type) or {}
+                self._mode_ids[self._vehicle_type] = mode_ids
 
-            mode_id = mode_mapping[mode_name.upper()]
+            # Mode names are upper case; only convert names that are not
+            mode_id = mode_ids.get(mode_name)
+            if mode_id is None:
+                mode_id = mode_ids.get(mode_name.upper())
+                if mode_id is None:
+                    raise ValueError(f"Unknown mode: {mode_name}")
             self._connection.master.set_mode(mode_id)
 
     @property
@@ -244,10 +277,10 @@ class FlightController:
         if not self._connection:
             raise APIException("No connection available")
 
-        self._connection.master.mav.command_long_send(
+        self._command_long_send(
             self._connection.target_system,
             0,  # component
-            mavutil.mavlink.MAV_CMD_NAV_TAKEOFF,
+            _CMD_TAKEOFF,
             0,  # confirmation
             0,
             0,
@@ -281,19 +314,14 @@ class FlightController:
         if not self._connection:
             raise APIException("No connection available")
 
-        # Determine frame
-        if isinstance(location, LocationGlobalRelative):
-            frame = mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT
-        else:
-            frame = mavutil.mavlink.MAV_FRAME_GLOBAL
-
-        # Send position target
+        # Send position target, in the frame of the location's class. Other
+        # location-like objects are taken as LocationGlobal.
         self._connection.master.mav.mission_item_send(
             self._connection.target_system,
             0,  # component
             0,  # seq
-            frame,
-            mavutil.mavlink.MAV_CMD_NAV_WAYPOINT,
+            getattr(location, "mav_frame", _FRAME_GLOBAL),
+            _CMD_NAV_WAYPOINT,
             2,  # current (2 = guided mode)
             0,  # autocontinue
             0,
@@ -315,10 +343,10 @@ class FlightController:
         """Set target airspeed."""
         if not self._connection:
             return
-        self._connection.master.mav.command_long_send(
+        self._command_long_send(
             self._connection.target_system,
             0,
-            mavutil.mavlink.MAV_CMD_DO_CHANGE_SPEED,
+            _CMD_CHANGE_SPEED,
             0,
             0,  # airspeed
             speed,
@@ -333,10 +361,10 @@ class FlightController:
         """Set target groundspeed."""
         if not self._connection:
             return
-        self._connection.master.mav.command_long_send(
+        self._command_long_send(
             self._connection.target_system,
             0,
-            mavutil.mavlink.MAV_CMD_DO_CHANGE_SPEED,
+            _CMD_CHANGE_SPEED,
             0,
             1,  # groundspeed
             speed,
@@ -373,8 +401,8 @@ class FlightController:
             0,  # time_boot_ms
             self._connection.target_system,
             0,  # component
-            mavutil.mavlink.MAV_FRAME_LOCAL_NED,
-            0b0000111111000111,  # type_mask (velocity only)
+            _FRAME_LOCAL_NED,
+            _VEL_ONLY_MASK,
             0,
             0,
             0,  # position (ignored)
@@ -388,6 +416,58 @@ class FlightController:
             0,  # yaw, yaw_rate (ignored)
         )
 
+    def start_velocity_stream(self) -> Callable[[float, float, float], None]:
+        """
+        Get a fast sender of NED velocity commands for high-rate loops.
+
+        The SET_POSITION_TARGET_LOCAL_NED message is encoded once; each
+        call of the returned function only updates its velocity fields
+        and sends it. This is the fast path for offboard and PID loops
+        streaming velocities at tens of Hz. The target system is fixed
+        when the stream is started, and the returned function must not
+        be shared between threads.
+
+        Returns:
+            Function taking (vx, vy, vz) in m/s, as for send_ned_velocity
+
+        Example:
+            >>> send_velocity = vehicle.start_velocity_stream()
+            >>> while flying:
+            ...     send_velocity(*pid.update())
+            ...     time.sleep(0.02)
+        """
+        if not self._connection:
+            raise APIException("No connection available")
+
+        mav = self._connection.master.mav
+        msg = mav.set_position_target_local_ned_encode(
+            0,  # time_boot_ms
+            self._connection.target_system,
+            0,  # component
+            _FRAME_LOCAL_NED,
+            _VEL_ONLY_MASK,
+            0,
+            0,
+            0,  # position (ignored)
+            0,
+            0,
+            0,  # velocity, set on each send
+            0,
+            0,
+            0,  # acceleration (ignored)
+            0,
+            0,  # yaw, yaw_rate (ignored)
+        )
+        send = mav.send
+
+        def send_velocity(vx: float, vy: float, vz: float) -> None:
+            msg.vx = vx
+            msg.vy = vy
+            msg.vz = vz
+            send(msg)
+
+        return send_velocity
+
     def send_global_velocity(
         self,
         vx: float,
@@ -409,8 +489,8 @@ class FlightController:
             0,  # time_boot_ms
             self._connection.target_system,
             0,  # component
-            mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT_INT,
-            0b0000111111000111,  # type_mask (velocity only)
+            _FRAME_GLOBAL_RELATIVE_ALT_INT,
+            _VEL_ONLY_MASK,
             0,
             0,
             0,  # position (ignored)
@@ -456,10 +536,10 @@ class FlightController:
         else:
             direction = -1
 
-        self._connection.master.mav.command_long_send(
+        self._command_long_send(
             self._connection.target_system,
             0,
-            mavutil.mavlink.MAV_CMD_CONDITION_YAW,
+            _CMD_CONDITION_YAW,
             0,
             heading,
             speed,
@@ -7,7 +7,7 @@ This module provides utility functions for navigation calculations.
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from dronesdk.models.location import (
@@ -20,6 +20,30 @@ if TYPE_CHECKING:
 EARTH_RADIUS = 6378137.0
 
 
+def _haversine_a(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine of the central angle between two points given in degrees."""
+    # Convert to radians
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+
+    # Haversine formula; squaring by multiplication avoids float pow
+    sin_half_dlat = math.sin(dlat / 2)
+    sin_half_dlon = math.sin(dlon / 2)
+    return (
+        sin_half_dlat * sin_half_dlat
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_half_dlon * sin_half_dlon
+    )
+
+
+def _haversine_arc(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Central angle in radians between two points given in degrees."""
+    # asin needs one sqrt where atan2 needs two; min() guards rounding
+    # past 1 for antipodal points
+    return 2 * math.asin(math.sqrt(min(_haversine_a(lat1, lon1, lat2, lon2), 1.0)))
+
+
 def get_distance_metres(
     location1: "LocationGlobal | LocationGlobalRelative",
     location2: "LocationGlobal | LocationGlobalRelative",
@@ -49,20 +73,65 @@ def get_distance_metres(
     if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
         raise ValueError("Location coordinates cannot be None")
 
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
+    return EARTH_RADIUS * _haversine_arc(lat1, lon1, lat2, lon2)
 
-    # Haversine formula
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-    return EARTH_RADIUS * c
+def get_distances_metres(
+    origin: "LocationGlobal | LocationGlobalRelative",
+    locations: Iterable["LocationGlobal | LocationGlobalRelative"],
+) -> list[float]:
+    """
+    Calculate the ground distances from one location to many others.
+
+    Gives the same results as calling get_distance_metres for each
+    location, but the origin's trigonometry is computed only once, which
+    makes nearest-waypoint and geofence scans cheaper.
+
+    Args:
+        origin: Location to measure from
+        locations: Locations to measure to
+
+    Returns:
+        Distance in meters to each location, in order
+
+    Example:
+        >>> distances = get_distances_metres(vehicle_location, waypoints)
+        >>> nearest = waypoints[distances.index(min(distances))]
+    """
+    lat1 = origin.lat
+    lon1 = origin.lon
+
+    if lat1 is None or lon1 is None:
+        raise ValueError("Location coordinates cannot be None")
+
+    lat1_rad = math.radians(lat1)
+    cos_lat1 = math.cos(lat1_rad)
+
+    # Local names for the loop
+    radians = math.radians
+    sin = math.sin
+    cos = math.cos
+    sqrt = math.sqrt
+    asin = math.asin
+
+    distances = []
+    for location in locations:
+        lat2 = location.lat
+        lon2 = location.lon
+        if lat2 is None or lon2 is None:
+            raise ValueError("Location coordinates cannot be None")
+
+        # Haversine formula, as in get_distance_metres
+        lat2_rad = radians(lat2)
+        sin_half_dlat = sin((lat2_rad - lat1_rad) / 2)
+        sin_half_dlon = sin(radians(lon2 - lon1) / 2)
+        a = (
+            sin_half_dlat * sin_half_dlat
+            + cos_lat1 * cos(lat2_rad) * sin_half_dlon * sin_half_dlon
+        )
+        distances.append(EARTH_RADIUS * 2 * asin(sqrt(min(a, 1.0))))
+
+    return distances
 
 
 def get_location_metres(
@@ -111,6 +180,54 @@ def get_location_metres(
         return LocationGlobal(new_lat, new_lon, original_location.alt)
 
 
+def get_locations_metres(
+    original_location: "LocationGlobal | LocationGlobalRelative",
+    offsets: Iterable[tuple[float, float]],
+) -> "list[LocationGlobal] | list[LocationGlobalRelative]":
+    """
+    Calculate several locations offset from one origin.
+
+    Gives the same results as calling get_location_metres for each
+    offset, but the degrees-per-metre scales are computed once for the
+    origin, so survey grids and patterns need no trigonometry per point.
+
+    Args:
+        original_location: Starting location
+        offsets: (dNorth, dEast) pairs in meters
+
+    Returns:
+        New locations, in order, of the same type as original_location
+
+    Example:
+        >>> home = LocationGlobalRelative(-35.36, 149.17, 20)
+        >>> grid = get_locations_metres(
+        ...     home, [(n, e) for n in range(0, 100, 10) for e in (0, 50)]
+        ... )
+    """
+    from dronesdk.models.location import LocationGlobal, LocationGlobalRelative
+
+    lat = original_location.lat
+    lon = original_location.lon
+
+    if lat is None or lon is None:
+        raise ValueError("Location coordinates cannot be None")
+
+    # Degrees per meter north and east of the origin
+    lat_scale = math.degrees(1 / EARTH_RADIUS)
+    lon_scale = math.degrees(1 / (EARTH_RADIUS * math.cos(math.radians(lat))))
+
+    if isinstance(original_location, LocationGlobalRelative):
+        location_class: type = LocationGlobalRelative
+    else:
+        location_class = LocationGlobal
+    alt = original_location.alt
+
+    return [
+        location_class(lat + dNorth * lat_scale, lon + dEast * lon_scale, alt)
+        for dNorth, dEast in offsets
+    ]
+
+
 def get_bearing(
     location1: "LocationGlobal | LocationGlobalRelative",
     location2: "LocationGlobal | LocationGlobalRelative",
@@ -144,15 +261,18 @@ def get_bearing(
     dlon = math.radians(lon2 - lon1)
 
     # Calculate bearing
-    x = math.sin(dlon) * math.cos(lat2_rad)
-    y = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(
-        lat2_rad
-    ) * math.cos(dlon)
+    cos_lat2 = math.cos(lat2_rad)
+    x = math.sin(dlon) * cos_lat2
+    y = (
+        math.cos(lat1_rad) * math.sin(lat2_rad)
+        - math.sin(lat1_rad) * cos_lat2 * math.cos(dlon)
+    )
 
     bearing = math.degrees(math.atan2(x, y))
 
-    # Normalize to 0-360
-    return (bearing + 360) % 360
+    # Normalize to 0-360. atan2 gives -180..180, so the dividend is positive
+    # and fmod matches % without the int-to-float coercions.
+    return math.fmod(bearing + 360.0, 360.0)
 
 
 def get_distance_3d(
@@ -169,13 +289,18 @@ def get_distance_3d(
     Returns:
         3D distance in meters
     """
-    ground_distance = get_distance_metres(location1, location2)
+    lat1 = location1.lat
+    lon1 = location1.lon
+    lat2 = location2.lat
+    lon2 = location2.lon
 
-    alt1 = location1.alt or 0
-    alt2 = location2.alt or 0
-    dalt = alt2 - alt1
+    if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
+        raise ValueError("Location coordinates cannot be None")
 
-    return math.sqrt(ground_distance**2 + dalt**2)
+    ground_distance = EARTH_RADIUS * _haversine_arc(lat1, lon1, lat2, lon2)
+    dalt = (location2.alt or 0) - (location1.alt or 0)
+
+    return math.hypot(ground_distance, dalt)
 
 
 def is_within_radius(
@@ -194,8 +319,25 @@ def is_within_radius(
     Returns:
         True if location is within radius of target
     """
-    distance = get_distance_metres(location, target)
-    return distance <= radius
+    lat1 = location.lat
+    lon1 = location.lon
+    lat2 = target.lat
+    lon2 = target.lon
+
+    if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
+        raise ValueError("Location coordinates cannot be None")
+
+    if radius < 0:
+        return False
+    half_arc = radius / (2 * EARTH_RADIUS)
+    if half_arc >= math.pi / 2:
+        # Radius reaches the antipode, so every location is inside
+        return True
+
+    # The haversine grows with distance, so comparing it against the
+    # haversine of the radius skips the sqrt and atan2 of the distance
+    sin_half_arc = math.sin(half_arc)
+    return _haversine_a(lat1, lon1, lat2, lon2) <= sin_half_arc * sin_half_arc
 
 
 def get_ground_course(vx: float, vy: float) -> float:
@@ -210,7 +352,7 @@ def get_ground_course(vx: float, vy: float) -> float:
         Course in degrees (0-360, 0 = North, 90 = East)
     """
     course = math.degrees(math.atan2(vy, vx))
-    return (course + 360) % 360
+    return math.fmod(course + 360.0, 360.0)
 
 
 def get_ground_speed(vx: float, vy: float) -> float:
@@ -224,4 +366,4 @@ def get_ground_speed(vx: float, vy: float) -> float:
     Returns:
         Ground speed in m/s
     """
-    return math.sqrt(vx**2 + vy**2)
+    return math.hypot(vx, vy)
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from pymavlink import mavutil
 
+from dronesdk.core.events import EventPriority
+
 if TYPE_CHECKING:
     from dronesdk.core.events import EventBus, MAVLinkMessageEvent
     from dronesdk.datalink.connection import MAVConnection
@@ -19,6 +21,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_MOUNT_MODE_MAVLINK_TARGETING = mavutil.mavlink.MAV_MOUNT_MODE_MAVLINK_TARGETING
+_MOUNT_MODE_GPS_POINT = mavutil.mavlink.MAV_MOUNT_MODE_GPS_POINT
+_MOUNT_MODE_RC_TARGETING = mavutil.mavlink.MAV_MOUNT_MODE_RC_TARGETING
+_CMD_DO_SET_ROI = mavutil.mavlink.MAV_CMD_DO_SET_ROI
+
+# Message types GimbalController.attach subscribes to, in handler order
+_GIMBAL_SUBSCRIPTIONS = ("MOUNT_STATUS", "MOUNT_ORIENTATION")
+
 
 @dataclass
 class GimbalState:
@@ -57,8 +67,10 @@ class GimbalController:
         "_roll",
         "_yaw",
         "_connection",
+        "_mav",
         "_on_update",
         "_unsubscribe_fns",
+        "_state",
     )
 
     def __init__(
@@ -69,8 +81,11 @@ class GimbalController:
         self._roll: float | None = None
         self._yaw: float | None = None
         self._connection: MAVConnection | None = None
+        self._mav: Any = None
         self._on_update = on_update
         self._unsubscribe_fns: list[Callable[[], None]] = []
+        # Built once per change of orientation and shared by readers
+        self._state = GimbalState(None, None, None)
 
     @property
     def name(self) -> str:
@@ -80,6 +95,7 @@ class GimbalController:
     def set_connection(self, connection: "MAVConnection") -> None:
         """Set the MAVLink connection for sending commands."""
         self._connection = connection
+        self._mav = connection.master.mav
 
     def attach(self, event_bus: "EventBus") -> None:
         """
@@ -88,22 +104,19 @@ class GimbalController:
         Args:
             event_bus: The event bus to subscribe to
         """
-        unsub1 = event_bus.subscribe_message(
-            "MOUNT_STATUS",
-            self._handle_mount_status,
-        )
-        unsub2 = event_bus.subscribe_message(
-            "MOUNT_ORIENTATION",
-            self._handle_mount_orientation,
-        )
-        self._unsubscribe_fns = [unsub1, unsub2]
+        handlers = (self._handle_mount_status, self._handle_mount_orientation)
+        self._unsubscribe_fns = [
+            event_bus.subscribe_message(msg_type, handler, priority=EventPriority.HIGH)
+            for msg_type, handler in zip(_GIMBAL_SUBSCRIPTIONS, handlers)
+        ]
         logger.debug("GimbalController attached to event bus")
 
     def detach(self) -> None:
         """Detach from the event bus."""
-        for unsub in self._unsubscribe_fns:
+        unsubscribe_fns = self._unsubscribe_fns
+        self._unsubscribe_fns = []
+        for unsub in unsubscribe_fns:
             unsub()
-        self._unsubscribe_fns.clear()
         logger.debug("GimbalController detached from event bus")
 
     def initialize(self) -> None:
@@ -113,35 +126,39 @@ class GimbalController:
     def _handle_mount_status(self, event: "MAVLinkMessageEvent") -> None:
         """Handle MOUNT_STATUS message."""
         msg = event.message
-        self._pitch = msg.pointing_a / 100.0
-        self._roll = msg.pointing_b / 100.0
-        self._yaw = msg.pointing_c / 100.0
-        self._notify_update()
+        self._update(
+            msg.pointing_a / 100.0,
+            msg.pointing_b / 100.0,
+            msg.pointing_c / 100.0,
+        )
 
     def _handle_mount_orientation(self, event: "MAVLinkMessageEvent") -> None:
         """Handle MOUNT_ORIENTATION message."""
         msg = event.message
-        self._pitch = msg.pitch
-        self._roll = msg.roll
-        self._yaw = msg.yaw
+        self._update(msg.pitch, msg.roll, msg.yaw)
+
+    def _update(self, pitch: float, roll: float, yaw: float) -> None:
+        """Store a reported orientation, notifying only when it changed."""
+        if pitch == self._pitch and roll == self._roll and yaw == self._yaw:
+            return
+        self._pitch = pitch
+        self._roll = roll
+        self._yaw = yaw
+        self._state = GimbalState(pitch=pitch, roll=roll, yaw=yaw)
         self._notify_update()
 
     def _notify_update(self) -> None:
         """Notify listeners of gimbal state change."""
         if self._on_update:
             try:
-                self._on_update(self.state)
+                self._on_update(self._state)
             except Exception:
                 logger.exception("Error in gimbal update callback")
 
     @property
     def state(self) -> GimbalState:
         """Get current gimbal state."""
-        return GimbalState(
-            pitch=self._pitch,
-            roll=self._roll,
-            yaw=self._yaw,
-        )
+        return self._state
 
     @property
     def pitch(self) -> float | None:
@@ -178,19 +195,11 @@ class GimbalController:
             logger.error("Cannot rotate gimbal: no connection")
             return
 
-        # Configure mount for MAVLink targeting
-        msg = self._connection.master.mav.mount_configure_encode(
-            0,
-            1,  # target system, target component
-            mavutil.mavlink.MAV_MOUNT_MODE_MAVLINK_TARGETING,
-            1,  # stabilize roll
-            1,  # stabilize pitch
-            1,  # stabilize yaw
-        )
-        self._connection.master.mav.send(msg)
+        self._configure_mount(_MOUNT_MODE_MAVLINK_TARGETING)
 
         # Send mount control
-        msg = self._connection.master.mav.mount_control_encode(
+        mav = self._mav
+        msg = mav.mount_control_encode(
             0,
             1,  # target system, target component
             int(pitch * 100),  # centidegrees
@@ -198,7 +207,7 @@ class GimbalController:
             int(yaw * 100),
             0,  # save position
         )
-        self._connection.master.mav.send(msg)
+        mav.send(msg)
 
     def target_location(
         self,
@@ -222,16 +231,7 @@ class GimbalController:
 
         from dronesdk.models.location import LocationGlobal, LocationGlobalRelative
 
-        # Configure mount for GPS targeting
-        msg = self._connection.master.mav.mount_configure_encode(
-            0,
-            1,
-            mavutil.mavlink.MAV_MOUNT_MODE_GPS_POINT,
-            1,
-            1,
-            1,  # stabilize roll, pitch, yaw
-        )
-        self._connection.master.mav.send(msg)
+        self._configure_mount(_MOUNT_MODE_GPS_POINT)
 
         # Calculate altitude relative to home
         if isinstance(location, LocationGlobalRelative):
@@ -248,10 +248,11 @@ class GimbalController:
             )
 
         # Send ROI command
-        msg = self._connection.master.mav.command_long_encode(
+        mav = self._mav
+        msg = mav.command_long_encode(
             0,
             1,
-            mavutil.mavlink.MAV_CMD_DO_SET_ROI,
+            _CMD_DO_SET_ROI,
             0,  # confirmation
             0,
             0,
@@ -261,7 +262,7 @@ class GimbalController:
             location.lon or 0,
             alt,
         )
-        self._connection.master.mav.send(msg)
+        mav.send(msg)
 
     def release(self) -> None:
         """
@@ -274,15 +275,19 @@ class GimbalController:
             logger.error("Cannot release gimbal: no connection")
             return
 
-        msg = self._connection.master.mav.mount_configure_encode(
+        self._configure_mount(_MOUNT_MODE_RC_TARGETING)
+
+    def _configure_mount(self, mode: int) -> None:
+        """Switch the mount mode, stabilizing all three axes."""
+        msg = self._mav.mount_configure_encode(
             0,
-            1,
-            mavutil.mavlink.MAV_MOUNT_MODE_RC_TARGETING,
-            1,
-            1,
-            1,  # stabilize roll, pitch, yaw
+            1,  # target system, target component
+            mode,
+            1,  # stabilize roll
+            1,  # stabilize pitch
+            1,  # stabilize yaw
         )
-        self._connection.master.mav.send(msg)
+        self._mav.send(msg)
 
     def __str__(self) -> str:
         return str(self.state)
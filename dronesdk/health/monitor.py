@@ -11,6 +11,10 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable
 
+from pymavlink import mavutil
+
+from dronesdk.core.events import EventPriority
+from dronesdk.datalink.heartbeat import _IGNORED_HB_TYPES, _decode_mode_name
 from dronesdk.models.status import SystemStatus, VehicleMode
 from dronesdk.models.version import Capabilities, Version
 
@@ -19,6 +23,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_ARMED_FLAG = mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED
+
+# MAV_STATE names indexed by value, MAV_STATE_UNINIT (0) to MAV_STATE_POWEROFF (7)
+_MAV_STATE_NAMES = (
+    "UNINIT",
+    "BOOT",
+    "CALIBRATING",
+    "STANDBY",
+    "ACTIVE",
+    "CRITICAL",
+    "EMERGENCY",
+    "POWEROFF",
+)
+
+# Message types HealthMonitor.attach subscribes to, in handler order
+_HEALTH_SUBSCRIPTIONS = ("HEARTBEAT", "EKF_STATUS_REPORT", "AUTOPILOT_VERSION")
+
 
 @dataclass
 class EKFStatus:
@@ -77,6 +98,9 @@ class HealthMonitor:
         "_on_mode_change",
         "_on_armed_change",
         "_unsubscribe_fns",
+        "_last_base_mode",
+        "_last_custom_mode",
+        "_last_system_status_raw",
     )
 
     def __init__(
@@ -95,6 +119,10 @@ class HealthMonitor:
         self._on_mode_change = on_mode_change
         self._on_armed_change = on_armed_change
         self._unsubscribe_fns: list[Callable[[], None]] = []
+        # Raw HEARTBEAT fields last handled; -1 until the first heartbeat
+        self._last_base_mode = -1
+        self._last_custom_mode = -1
+        self._last_system_status_raw = -1
 
     @property
     def name(self) -> str:
@@ -108,23 +136,24 @@ class HealthMonitor:
         Args:
             event_bus: The event bus to subscribe to
         """
-        subscriptions = [
-            ("HEARTBEAT", self._handle_heartbeat),
-            ("EKF_STATUS_REPORT", self._handle_ekf_status),
-            ("AUTOPILOT_VERSION", self._handle_autopilot_version),
+        handlers = (
+            self._handle_heartbeat,
+            self._handle_ekf_status,
+            self._handle_autopilot_version,
+        )
+        self._unsubscribe_fns += [
+            event_bus.subscribe_message(msg_type, handler, priority=EventPriority.HIGH)
+            for msg_type, handler in zip(_HEALTH_SUBSCRIPTIONS, handlers)
         ]
 
-        for msg_type, handler in subscriptions:
-            unsub = event_bus.subscribe_message(msg_type, handler)
-            self._unsubscribe_fns.append(unsub)
-
         logger.debug("HealthMonitor attached to event bus")
 
     def detach(self) -> None:
         """Detach from the event bus."""
-        for unsub in self._unsubscribe_fns:
+        unsubscribe_fns = self._unsubscribe_fns
+        self._unsubscribe_fns = []
+        for unsub in unsubscribe_fns:
             unsub()
-        self._unsubscribe_fns.clear()
         logger.debug("HealthMonitor detached from event bus")
 
     def initialize(self) -> None:
@@ -133,39 +162,44 @@ class HealthMonitor:
 
     def _handle_heartbeat(self, event: "MAVLinkMessageEvent") -> None:
         """Handle HEARTBEAT message."""
-        from pymavlink import mavutil
-
         msg = event.message
 
         # Ignore non-vehicle heartbeats
-        if msg.type in (
-            mavutil.mavlink.MAV_TYPE_GCS,
-            mavutil.mavlink.MAV_TYPE_GIMBAL,
-            mavutil.mavlink.MAV_TYPE_ADSB,
-            mavutil.mavlink.MAV_TYPE_ONBOARD_CONTROLLER,
+        if msg.type in _IGNORED_HB_TYPES:
+            return
+
+        autopilot = msg.autopilot
+        vehicle_type = msg.type
+        base_mode = msg.base_mode
+        custom_mode = msg.custom_mode
+        system_status = msg.system_status
+
+        # Status, armed state and mode rarely change between heartbeats
+        if (
+            base_mode == self._last_base_mode
+            and custom_mode == self._last_custom_mode
+            and system_status == self._last_system_status_raw
+            and autopilot == self._autopilot_type
+            and vehicle_type == self._vehicle_type
         ):
             return
+        self._last_base_mode = base_mode
+        self._last_custom_mode = custom_mode
+        self._last_system_status_raw = system_status
 
         # Store autopilot and vehicle type
-        self._autopilot_type = msg.autopilot
-        self._vehicle_type = msg.type
+        self._autopilot_type = autopilot
+        self._vehicle_type = vehicle_type
 
         # Update system status
-        state_map = {
-            mavutil.mavlink.MAV_STATE_UNINIT: "UNINIT",
-            mavutil.mavlink.MAV_STATE_BOOT: "BOOT",
-            mavutil.mavlink.MAV_STATE_CALIBRATING: "CALIBRATING",
-            mavutil.mavlink.MAV_STATE_STANDBY: "STANDBY",
-            mavutil.mavlink.MAV_STATE_ACTIVE: "ACTIVE",
-            mavutil.mavlink.MAV_STATE_CRITICAL: "CRITICAL",
-            mavutil.mavlink.MAV_STATE_EMERGENCY: "EMERGENCY",
-            mavutil.mavlink.MAV_STATE_POWEROFF: "POWEROFF",
-        }
-        state_name = state_map.get(msg.system_status, "UNKNOWN")
+        if system_status < len(_MAV_STATE_NAMES):
+            state_name = _MAV_STATE_NAMES[system_status]
+        else:
+            state_name = "UNKNOWN"
         self._system_status = SystemStatus.from_mavlink(state_name)
 
         # Update armed state
-        new_armed = bool(msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED)
+        new_armed = bool(base_mode & _ARMED_FLAG)
         if self._armed != new_armed:
             self._armed = new_armed
             if self._on_armed_change:
@@ -175,17 +209,7 @@ class HealthMonitor:
                     logger.exception("Error in armed change callback")
 
         # Update mode
-        if self._autopilot_type == mavutil.mavlink.MAV_AUTOPILOT_PX4:
-            mode_name = mavutil.interpret_px4_mode(
-                msg.base_mode,
-                msg.custom_mode,
-            )
-        else:
-            mode_mapping = mavutil.mode_mapping_bynumber(self._vehicle_type)
-            if mode_mapping:
-                mode_name = mode_mapping.get(msg.custom_mode, "UNKNOWN")
-            else:
-                mode_name = "UNKNOWN"
+        mode_name = _decode_mode_name(autopilot, vehicle_type, base_mode, custom_mode)
 
         if self._mode is None or self._mode.name != mode_name:
             self._mode = VehicleMode.from_mavlink(mode_name)
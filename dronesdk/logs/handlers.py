@@ -20,13 +20,28 @@ class ErrprinterHandler(logging.Handler):
 
     def __init__(self) -> None:
         super().__init__()
-        self.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        self._default_formatter = logging.Formatter("%(levelname)s: %(message)s")
+        self.setFormatter(self._default_formatter)
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Emit a log record to stderr."""
+        """Emit a log record to stderr, flushing for ERROR and above."""
         try:
-            msg = self.format(record)
-            print(msg, file=sys.stderr)
+            if (
+                self.formatter is self._default_formatter
+                and not record.exc_info
+                and not record.exc_text
+                and not record.stack_info
+            ):
+                # Same output as the default formatter, without its
+                # format-string substitution and traceback checks
+                msg = f"{record.levelname}: {record.getMessage()}"
+            else:
+                msg = self.format(record)
+            # Looked up per record so redirect_stderr and capture work
+            stream = sys.stderr
+            stream.write(msg + "\n")
+            if record.levelno >= logging.ERROR:
+                stream.flush()
         except Exception:
             self.handleError(record)
 
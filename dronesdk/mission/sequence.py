@@ -9,10 +9,10 @@ from __future__ import annotations
 
 import logging
 import time
+from time import monotonic as _monotonic
 from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-import monotonic
-
+from dronesdk.core.events import EventPriority
 from dronesdk.core.exceptions import APIException
 from dronesdk.models.command import Command
 
@@ -99,7 +99,9 @@ class CommandSequence:
         ]
 
         for msg_type, handler in subscriptions:
-            unsub = event_bus.subscribe_message(msg_type, handler)
+            unsub = event_bus.subscribe_message(
+                msg_type, handler, priority=EventPriority.HIGH
+            )
             self._unsubscribe_fns.append(unsub)
 
         logger.debug("CommandSequence attached to event bus")
@@ -237,9 +239,9 @@ class CommandSequence:
         Raises:
             APIException: If connection is lost
         """
-        start = monotonic.monotonic()
+        start = _monotonic()
         while self._downloading or not self._download_complete:
-            if (monotonic.monotonic() - start) > timeout:
+            if (_monotonic() - start) > timeout:
                 return False
             if self._connection and not self._connection.is_alive:
                 raise APIException("Connection lost during mission download")
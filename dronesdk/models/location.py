@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass
@@ -31,6 +31,9 @@ class LocationGlobal:
         alt: Altitude in meters relative to mean sea-level (MSL).
     """
 
+    # MAV_FRAME used when sending this location (MAV_FRAME_GLOBAL)
+    mav_frame: ClassVar[int] = 0
+
     lat: float | None
     lon: float | None
     alt: float | None = None
@@ -85,6 +88,9 @@ class LocationGlobalRelative:
         alt: Altitude in meters relative to home location.
     """
 
+    # MAV_FRAME used when sending this location (MAV_FRAME_GLOBAL_RELATIVE_ALT)
+    mav_frame: ClassVar[int] = 3
+
     lat: float | None
     lon: float | None
     alt: float | None = None
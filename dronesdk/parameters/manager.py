@@ -10,12 +10,13 @@ from __future__ import annotations
 import logging
 import struct
 import sys
+import threading
 import time
 from collections.abc import MutableMapping
+from time import monotonic as _monotonic
 from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-import monotonic
-
+from dronesdk.core.events import EventPriority
 from dronesdk.core.exceptions import APIException
 from dronesdk.core.observer import HasObservers
 
@@ -60,6 +61,7 @@ class ParameterManager(MutableMapping, HasObservers):
         self._params_set: set[str] = set()
         self._connection: MAVConnection | None = None
         self._loaded = False
+        self._wait_ready_event = threading.Event()
         self._unsubscribe: Callable[[], None] | None = None
 
     @property
@@ -83,6 +85,7 @@ class ParameterManager(MutableMapping, HasObservers):
         self._unsubscribe = event_bus.subscribe_message(
             "PARAM_VALUE",
             self._handle_param_value,
+            priority=EventPriority.HIGH,
         )
         logger.debug("ParameterManager attached to event bus")
 
@@ -129,6 +132,7 @@ class ParameterManager(MutableMapping, HasObservers):
         # Check if all parameters loaded
         if not self._loaded and len(self._params_set) >= self._params_count > 0:
             self._loaded = True
+            self._wait_ready_event.set()
             logger.info("All %d parameters loaded", self._params_count)
 
     @property
@@ -149,13 +153,14 @@ class ParameterManager(MutableMapping, HasObservers):
         Raises:
             APIException: If connection is lost
         """
-        start = monotonic.monotonic()
+        start = _monotonic()
         while not self._loaded:
-            if timeout and (monotonic.monotonic() - start) > timeout:
+            if timeout and (_monotonic() - start) > timeout:
                 return False
             if self._connection and not self._connection.is_alive:
                 raise APIException("Connection lost while waiting for parameters")
-            time.sleep(0.1)
+            # Wakes as soon as the last parameter arrives
+            self._wait_ready_event.wait(0.1)
         return True
 
     def __getitem__(self, name: str) -> float:
@@ -245,14 +250,14 @@ class ParameterManager(MutableMapping, HasObservers):
         remaining = retries
         while True:
             self._connection.master.param_set_send(name, value)
-            tstart = monotonic.monotonic()
+            tstart = _monotonic()
 
             if remaining == 0:
                 break
             remaining -= 1
 
             # Wait for acknowledgment
-            while monotonic.monotonic() - tstart < 1:
+            while _monotonic() - tstart < 1:
                 if name in self._params and self._params[name] == value:
                     return True
                 time.sleep(0.1)
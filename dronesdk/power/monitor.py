@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
+from dronesdk.core.events import EventPriority
 from dronesdk.models.battery import Battery
 
 if TYPE_CHECKING:
@@ -59,6 +60,7 @@ class BatteryMonitor:
         self._unsubscribe = event_bus.subscribe_message(
             "SYS_STATUS",
             self._handle_sys_status,
+            priority=EventPriority.HIGH,
         )
         logger.debug("BatteryMonitor attached to event bus")
 
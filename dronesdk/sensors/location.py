@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
+from dronesdk.core.events import EventPriority
 from dronesdk.core.observer import HasObservers
 from dronesdk.models.location import (
     LocationGlobal,
@@ -87,10 +88,12 @@ class Locations(HasObservers):
         unsub1 = event_bus.subscribe_message(
             "GLOBAL_POSITION_INT",
             self._handle_global_position,
+            priority=EventPriority.HIGH,
         )
         unsub2 = event_bus.subscribe_message(
             "LOCAL_POSITION_NED",
             self._handle_local_position,
+            priority=EventPriority.HIGH,
         )
         self._unsubscribe_fns = [unsub1, unsub2]
         logger.debug("Locations attached to event bus")
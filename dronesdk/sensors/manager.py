@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
+from dronesdk.core.events import EventPriority
 from dronesdk.models.attitude import Attitude
 from dronesdk.models.sensors import GPSInfo, Rangefinder, Wind
 
@@ -84,7 +85,9 @@ class SensorManager:
         ]
 
         for msg_type, handler in subscriptions:
-            unsub = event_bus.subscribe_message(msg_type, handler)
+            unsub = event_bus.subscribe_message(
+                msg_type, handler, priority=EventPriority.HIGH
+            )
             self._unsubscribe_fns.append(unsub)
 
         logger.debug("SensorManager attached to event bus")
@@ -17,7 +17,6 @@ setuptools.setup(
     author="winter2897",
     install_requires=[
         "pymavlink>=2.2.20",
-        "monotonic>=1.3",
     ],
     author_email="haiquantran2897@gmail.com",
     classifiers=[